@@ -1,20 +1,70 @@
 """FreshBooks API client with automatic token management."""
 
-from typing import Any, Optional
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, TypeVar
 
 import httpx
+import orjson
 from rich.console import Console
 
 from ..auth import ensure_valid_token, refresh_access_token
-from ..config import Config, load_account_info, save_account_info, save_tokens
+from ..config import (
+    Config,
+    load_account_info,
+    load_cache,
+    prune_cache,
+    save_account_info,
+    save_cache,
+    save_tokens,
+)
 from ..exceptions import AuthenticationError, RateLimitError, NetworkError, APIResponseError
 
 console = Console()
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def unwrap_result(response: dict[str, Any]) -> dict[str, Any]:
+    """Return the response.result payload of an accounting API response, or {}."""
+    try:
+        return response["response"]["result"]
+    except (KeyError, TypeError):
+        return {}
+
+
+def _unwrap_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Return the top-level response payload of an auth API response, or {}."""
+    try:
+        return response["response"]
+    except (KeyError, TypeError):
+        return {}
+
 
 class FreshBooksClient:
     """HTTP client for FreshBooks API with automatic token refresh."""
 
+    __slots__ = (
+        "config",
+        "_client",
+        "_account_id",
+        "_business_id",
+        "_headers_cache",
+        "_accounting_prefix",
+        "_timetracking_prefix",
+        "_projects_prefix",
+        "_comments_prefix",
+        "_persisted_account_info",
+        "_response_cache",
+        "_response_cache_lock",
+        "_client_lock",
+        "_refresh_lock",
+    )
+
     BASE_AUTH_URL = "https://api.freshbooks.com/auth/api/v1"
     BASE_ACCOUNTING_URL = "https://api.freshbooks.com/accounting/account"
     BASE_TIMETRACKING_URL = "https://api.freshbooks.com/timetracking/business"
@@ -24,51 +74,135 @@ class FreshBooksClient:
     def __init__(self, config: Config):
         self.config = config
         self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
         self._account_id: Optional[str] = None
         self._business_id: Optional[int] = None
+        self._headers_cache: Optional[tuple[str, dict[str, str]]] = None
+        self._refresh_lock = threading.Lock()
+        self._accounting_prefix: Optional[str] = None
+        self._timetracking_prefix: Optional[str] = None
+        self._projects_prefix: Optional[str] = None
+        self._comments_prefix: Optional[str] = None
+        self._response_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
 
         saved_account, saved_business = load_account_info()
         self._account_id = saved_account
         self._business_id = saved_business
+        self._persisted_account_info: tuple[Optional[str], Optional[int]] = (
+            saved_account,
+            saved_business,
+        )
+
+    MAX_CONCURRENT_REQUESTS = 8
+
+    # Decoded bodies kept in-process for cache_ttl GETs; older entries are
+    # still on disk, this only bounds how many raw pages stay in memory.
+    RESPONSE_CACHE_SIZE = 16
+
+    DEFAULT_HEADERS = {
+        "Api-Version": "alpha",
+        "Content-Type": "application/json",
+    }
 
     @property
     def client(self) -> httpx.Client:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.Client(timeout=30.0)
-        return self._client
+        """Get or create HTTP client.
+
+        The client speaks HTTP/2 so paginated requests multiplex over one
+        connection, and carries the static headers as defaults so only the
+        Authorization header varies per request.
+        """
+        client = self._client
+        if client is None:
+            # Worker threads from map_concurrent may race here on first use;
+            # build exactly one client so they all share its connection pool.
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client(
+                        timeout=httpx.Timeout(30.0, connect=10.0),
+                        http2=True,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=20,
+                            max_connections=100,
+                            keepalive_expiry=30.0,
+                        ),
+                        headers=self.DEFAULT_HEADERS,
+                    )
+        return client
 
     @property
     def headers(self) -> dict[str, str]:
-        """Get authorization headers."""
-        tokens = ensure_valid_token(self.config)
-        return {
-            "Authorization": f"Bearer {tokens.access_token}",
-            "Api-Version": "alpha",
-            "Content-Type": "application/json",
-        }
+        """Get authorization headers, rebuilt only when the access token changes.
+
+        The proactive refresh of an expired token runs under the same lock as
+        the refresh after a 401, so concurrent workers refresh only once.
+        """
+        with self._refresh_lock:
+            tokens = ensure_valid_token(self.config)
+        cached = self._headers_cache
+        if cached is not None and cached[0] == tokens.access_token:
+            return cached[1]
+        headers = {"Authorization": f"Bearer {tokens.access_token}"}
+        self._headers_cache = (tokens.access_token, headers)
+        return headers
 
     def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Handle API response with proper error mapping."""
-        try:
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise AuthenticationError("API authentication failed") from e
-            elif e.response.status_code == 429:
-                retry_after = e.response.headers.get("Retry-After")
-                raise RateLimitError(retry_after=retry_after) from e
-            else:
-                raise APIResponseError(f"API error {e.response.status_code}: {e.response.text[:200]}") from e
-
-    def _make_request(self, method: str, url: str, **kwargs) -> httpx.Response:
-        """Make HTTP request with network error handling."""
+        """Handle API response with proper error mapping.
+
+        Maps on the status code directly rather than via raise_for_status(),
+        so the common 401-then-refresh path doesn't build an HTTPStatusError.
+        Successful responses without a body (e.g. 204 No Content) decode to {}.
+        """
+        status_code = response.status_code
+        if 200 <= status_code < 300:
+            content = response.content
+            return orjson.loads(content) if content else {}
+        if status_code == 401:
+            raise AuthenticationError("API authentication failed")
+        if status_code == 429:
+            raise RateLimitError(retry_after=response.headers.get("Retry-After"))
+        raise APIResponseError(f"API error {status_code}: {response.text[:200]}")
+
+    def _refresh_headers(self, stale: dict[str, str]) -> dict[str, str]:
+        """Refresh the token after a 401 and return the new authorization headers.
+
+        FreshBooks refresh tokens are single-use, so concurrent workers that
+        hit a 401 together must refresh only once: the first one through the
+        lock refreshes, and the rest reuse its headers.
+
+        Args:
+            stale: Authorization headers the rejected request was sent with
+        """
+        with self._refresh_lock:
+            cached = self._headers_cache
+            if cached is not None and cached[1] != stale:
+                return cached[1]
+            console.print("[dim]Token expired, refreshing...[/dim]")
+            tokens = refresh_access_token(self.config)
+            save_tokens(tokens)
+            self.config.tokens = tokens
+            headers = {"Authorization": f"Bearer {tokens.access_token}"}
+            self._headers_cache = (tokens.access_token, headers)
+            return headers
+
+    def _make_request(
+        self, method: str, url: str, headers: Optional[dict[str, str]] = None, **kwargs
+    ) -> httpx.Response:
+        """Make HTTP request with network error handling.
+
+        Uses ``headers`` when given instead of re-validating the token.
+        """
+        if headers is None:
+            headers = self.headers
+        request = self.client.build_request(method, url, headers=headers, **kwargs)
+        return self._send(request)
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send a prepared request, mapping transport failures to NetworkError."""
         try:
-            if method == "GET":
-                return self.client.get(url, headers=self.headers, **kwargs)
-            else:
-                return self.client.post(url, headers=self.headers, **kwargs)
+            return self.client.send(request)
         except httpx.TimeoutException as e:
             raise NetworkError("Request timed out") from e
         except httpx.ConnectError as e:
@@ -76,37 +210,150 @@ class FreshBooksClient:
         except httpx.RequestError as e:
             raise NetworkError(f"Network error: {e}") from e
 
-    def get(self, url: str, params: Optional[dict] = None) -> dict[str, Any]:
-        """Make authenticated GET request with automatic token refresh on 401."""
+    def get(
+        self, url: str, params: Optional[dict] = None, cache_ttl: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Make authenticated GET request with automatic token refresh on 401.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            cache_ttl: If set, serve the response from the in-process or
+                on-disk response cache when it is younger than this many
+                seconds. Older entries that carry an ETag are revalidated
+                with If-None-Match, and a 304 reuses the cached body.
+                Ignored when the config has use_cache disabled.
+        """
+        if not cache_ttl or not self.config.use_cache:
+            return self._get(url, params)
+
+        key = self._response_cache_key(url, params)
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+        if entry is None:
+            entry = load_cache(key, float("inf"))
+            if type(entry) is not dict or "fetched_at" not in entry:
+                entry = None
+
+        if entry is None or time.time() - entry["fetched_at"] >= cache_ttl:
+            etag = entry.get("etag") if entry else None
+            body, etag = self._get_with_etag(url, params, etag)
+            if body is None:
+                body = entry["body"]
+            entry = {"fetched_at": time.time(), "etag": etag, "body": body}
+            save_cache(key, entry)
+
+        with self._response_cache_lock:
+            self._response_cache[key] = entry
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return entry["body"]
+
+    def _get_with_etag(
+        self, url: str, params: Optional[dict], etag: Optional[str]
+    ) -> tuple[Optional[dict[str, Any]], Optional[str]]:
+        """GET that sends If-None-Match when an ETag is known.
+
+        Returns:
+            Tuple of (decoded body, or None on 304 Not Modified; response ETag)
+        """
+        conditional = {"If-None-Match": etag} if etag else {}
+        headers = self.headers
+        response = self._make_request("GET", url, {**headers, **conditional}, params=params)
+        if response.status_code == 401:
+            headers = self._refresh_headers(headers)
+            response = self._make_request("GET", url, {**headers, **conditional}, params=params)
+        if response.status_code == 304 and etag:
+            return None, etag
+        return self._handle_response(response), response.headers.get("ETag")
+
+    @staticmethod
+    def _response_cache_key(url: str, params: Optional[dict]) -> str:
+        """Cache file name for a GET request, derived from its URL and params."""
+        request_id = orjson.dumps([url, sorted((params or {}).items())])
+        return f"http-{hashlib.sha256(request_id).hexdigest()[:32]}.json"
+
+    def _get(self, url: str, params: Optional[dict] = None) -> dict[str, Any]:
+        """Uncached GET with a single token refresh and retry on 401."""
+        headers = self.headers
         try:
-            response = self._make_request("GET", url, params=params)
+            response = self._make_request("GET", url, headers, params=params)
             return self._handle_response(response)
         except AuthenticationError:
-            console.print("[dim]Token expired, refreshing...[/dim]")
-            tokens = refresh_access_token(self.config)
-            save_tokens(tokens)
-            self.config.tokens = tokens
-            response = self._make_request("GET", url, params=params)
+            headers = self._refresh_headers(headers)
+            response = self._make_request("GET", url, headers, params=params)
             return self._handle_response(response)
 
     def post(self, url: str, data: Optional[dict] = None) -> dict[str, Any]:
         """Make authenticated POST request with automatic token refresh on 401."""
+        return self._send_json("POST", url, data)
+
+    def put(self, url: str, data: Optional[dict] = None) -> dict[str, Any]:
+        """Make authenticated PUT request with automatic token refresh on 401."""
+        return self._send_json("PUT", url, data)
+
+    def _send_json(self, method: str, url: str, data: Optional[dict]) -> dict[str, Any]:
+        """Send an orjson-encoded body, retrying once after a token refresh on 401."""
+        body = orjson.dumps(data) if data is not None else None
+        headers = self.headers
         try:
-            response = self._make_request("POST", url, json=data)
+            response = self._make_request(method, url, headers, content=body)
             return self._handle_response(response)
         except AuthenticationError:
-            console.print("[dim]Token expired, refreshing...[/dim]")
-            tokens = refresh_access_token(self.config)
-            save_tokens(tokens)
-            self.config.tokens = tokens
-            response = self._make_request("POST", url, json=data)
+            headers = self._refresh_headers(headers)
+            response = self._make_request(method, url, headers, content=body)
             return self._handle_response(response)
 
+    def get_pages(self, url: str, params: dict, pages: Iterable[int]) -> list[dict[str, Any]]:
+        """Fetch several pages of one listing concurrently.
+
+        The URL, query string and headers are prepared once; each page only
+        swaps the ``page`` query parameter on a copy of that template.
+
+        Args:
+            url: Listing endpoint URL
+            params: Query parameters shared by every page
+            pages: Page numbers to fetch
+
+        Returns:
+            Decoded responses in the same order as ``pages``
+        """
+        template = self.client.build_request("GET", url, params=params, headers=self.headers)
+
+        def fetch(page: int) -> dict[str, Any]:
+            request = httpx.Request(
+                "GET",
+                template.url.copy_merge_params({"page": page}),
+                headers=template.headers,
+            )
+            try:
+                return self._handle_response(self._send(request))
+            except AuthenticationError:
+                return self._get(url, {**params, "page": page})
+
+        return self.map_concurrent(fetch, pages)
+
+    def map_concurrent(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply fn to each item on a thread pool, returning results in input order.
+
+        Used to overlap independent requests (e.g. pages 2..N of a listing)
+        over the shared connection pool.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+
+        workers = min(self.MAX_CONCURRENT_REQUESTS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
+
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and drop stale on-disk cache entries."""
         if self._client:
             self._client.close()
             self._client = None
+            prune_cache()
 
     def __enter__(self) -> "FreshBooksClient":
         return self
@@ -114,56 +361,31 @@ class FreshBooksClient:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
-    async def get_current_user(self) -> dict[str, Any]:
+    def get_current_user(self) -> dict[str, Any]:
         """Get current user identity and business memberships."""
         url = f"{self.BASE_AUTH_URL}/users/me"
         params = {"include": "business_memberships"}
         return self.get(url, params)
 
-    async def fetch_account_info(self) -> tuple[str, int]:
-        """Fetch and cache account_id and business_id."""
-        if self._account_id and self._business_id:
-            return self._account_id, self._business_id
-
-        response = self.get(f"{self.BASE_AUTH_URL}/users/me")
-        user_response = response.get("response", {})
-
-        memberships = user_response.get("business_memberships", [])
-        if not memberships:
-            raise ValueError("No business memberships found for this user")
-
-        membership = memberships[0]
-        business = membership.get("business", {})
-        self._account_id = business.get("account_id")
-        self._business_id = business.get("id")
-
-        if not self._account_id or not self._business_id:
-            raise ValueError("Could not determine account_id or business_id")
-
-        save_account_info(self._account_id, self._business_id)
-        return self._account_id, self._business_id
-
     @property
     def account_id(self) -> str:
         """Get account ID, fetching if necessary."""
         if not self._account_id:
-            import asyncio
-            asyncio.get_event_loop().run_until_complete(self.fetch_account_info())
+            self.ensure_account_info()
         return self._account_id
 
     @property
     def business_id(self) -> int:
         """Get business ID, fetching if necessary."""
         if not self._business_id:
-            import asyncio
-            asyncio.get_event_loop().run_until_complete(self.fetch_account_info())
+            self.ensure_account_info()
         return self._business_id
 
     def ensure_account_info(self) -> tuple[str, int]:
-        """Ensure account info is loaded synchronously."""
+        """Fetch and cache account_id and business_id if not already known."""
         if not self._account_id or not self._business_id:
             response = self.get(f"{self.BASE_AUTH_URL}/users/me")
-            user_response = response.get("response", {})
+            user_response = _unwrap_response(response)
 
             memberships = user_response.get("business_memberships", [])
             if not memberships:
@@ -177,29 +399,42 @@ class FreshBooksClient:
             if not self._account_id or not self._business_id:
                 raise ValueError("Could not determine account_id or business_id")
 
-            save_account_info(self._account_id, self._business_id)
+            fetched = (self._account_id, self._business_id)
+            if fetched != self._persisted_account_info:
+                save_account_info(*fetched)
+                self._persisted_account_info = fetched
+
+        if self._accounting_prefix is None:
+            self._accounting_prefix = f"{self.BASE_ACCOUNTING_URL}/{self._account_id}"
+            self._timetracking_prefix = f"{self.BASE_TIMETRACKING_URL}/{self._business_id}"
+            self._projects_prefix = f"{self.BASE_PROJECTS_URL}/{self._business_id}"
+            self._comments_prefix = f"{self.BASE_COMMENTS_URL}/{self._business_id}"
 
         return self._account_id, self._business_id
 
     def accounting_url(self, path: str) -> str:
         """Build accounting API URL."""
-        account_id, _ = self.ensure_account_info()
-        return f"{self.BASE_ACCOUNTING_URL}/{account_id}/{path}"
+        if self._accounting_prefix is None:
+            self.ensure_account_info()
+        return f"{self._accounting_prefix}/{path}"
 
     def timetracking_url(self, path: str) -> str:
         """Build time tracking API URL."""
-        _, business_id = self.ensure_account_info()
-        return f"{self.BASE_TIMETRACKING_URL}/{business_id}/{path}"
+        if self._timetracking_prefix is None:
+            self.ensure_account_info()
+        return f"{self._timetracking_prefix}/{path}"
 
     def projects_url(self, path: str) -> str:
         """Build projects API URL (includes services in response)."""
-        _, business_id = self.ensure_account_info()
-        return f"{self.BASE_PROJECTS_URL}/{business_id}/{path}"
+        if self._projects_prefix is None:
+            self.ensure_account_info()
+        return f"{self._projects_prefix}/{path}"
 
     def comments_url(self, path: str) -> str:
         """Build comments/services API URL."""
-        _, business_id = self.ensure_account_info()
-        return f"{self.BASE_COMMENTS_URL}/{business_id}/{path}"
+        if self._comments_prefix is None:
+            self.ensure_account_info()
+        return f"{self._comments_prefix}/{path}"
 
     def auth_url(self, path: str) -> str:
         """Build auth API URL."""
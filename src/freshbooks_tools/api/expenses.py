@@ -2,64 +2,114 @@
 
 from __future__ import annotations
 
+import math
+import sys
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from ..models import Expense, ExpenseCategory
-from .client import FreshBooksClient
+from ..config import delete_cache, load_cache, save_cache
+from .client import FreshBooksClient, unwrap_result
+
+
+def _dec(value: Any) -> Optional[Decimal]:
+    """Convert an API money value (scalar or {"amount": ...} dict) to Decimal."""
+    if type(value) is dict:
+        value = value.get("amount")
+    if value is None or value == "":
+        return None
+    value_type = type(value)
+    if value_type is str or value_type is int:
+        return Decimal(value)
+    if value_type is Decimal:
+        return value
+    return Decimal(str(value))
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values that repeat across many rows (vendors, tax names)."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _parse_expense(data: dict) -> Expense:
+    """Parse expense data from API response."""
+    get = data.get
+    amount_data = get("amount")
+    amount = _dec(amount_data)
+    currency_code = _intern(amount_data.get("code", "USD")) if type(amount_data) is dict else "USD"
+
+    return Expense(
+        expenseid=data["expenseid"],
+        amount=amount if amount is not None else Decimal("0"),
+        currency_code=currency_code,
+        date=get("date", ""),
+        vendor=_intern(get("vendor")),
+        categoryid=get("categoryid"),
+        staffid=get("staffid"),
+        clientid=get("clientid"),
+        projectid=get("projectid"),
+        notes=get("notes"),
+        status=get("status", 0),
+        taxAmount1=_dec(get("taxAmount1")),
+        taxAmount2=_dec(get("taxAmount2")),
+        taxName1=_intern(get("taxName1")),
+        taxName2=_intern(get("taxName2")),
+        invoiceid=get("invoiceid"),
+        vis_state=get("vis_state", 0),
+    )
+
+
+def _parse_expense_page(response: dict[str, Any]) -> tuple[list[Expense], int]:
+    """Parse one page of an expenses listing into (expenses, total)."""
+    result = unwrap_result(response)
+    expenses_data = result.get("expenses", [])
+    total = result.get("total", len(expenses_data))
+
+    expenses = []
+    for exp_data in expenses_data:
+        if "expenseid" not in exp_data:
+            continue
+        try:
+            expenses.append(_parse_expense(exp_data))
+        except ValueError:
+            continue
+
+    return expenses, total
+
+
+def _parse_category_page(response: dict[str, Any]) -> tuple[list[ExpenseCategory], int]:
+    """Parse one page of an expense categories listing into (categories, total)."""
+    result = unwrap_result(response)
+    categories_data = result.get("categories", [])
+    total = result.get("total", len(categories_data))
+
+    categories = []
+    for cat_data in categories_data:
+        try:
+            category = ExpenseCategory(
+                categoryid=cat_data["categoryid"],
+                category=cat_data.get("category", ""),
+                is_cogs=cat_data.get("is_cogs", False),
+                vis_state=cat_data.get("vis_state", 0),
+            )
+            categories.append(category)
+        except (KeyError, ValueError):
+            continue
+
+    return categories, total
 
 
 class ExpensesAPI:
     """API for querying expenses."""
 
+    __slots__ = ("client", "_categories_cache")
+
+    CATEGORIES_CACHE_TTL = 86400
+
     def __init__(self, client: FreshBooksClient):
         self.client = client
         self._categories_cache: Optional[dict[int, ExpenseCategory]] = None
 
-    def _parse_expense(self, data: dict) -> Expense:
-        """Parse expense data from API response."""
-        amount_data = data.get("amount", {})
-        if isinstance(amount_data, dict):
-            amount = Decimal(str(amount_data.get("amount", "0")))
-            currency_code = amount_data.get("code", "USD")
-        else:
-            amount = Decimal(str(amount_data)) if amount_data else Decimal("0")
-            currency_code = "USD"
-
-        tax_amount1 = None
-        tax1_data = data.get("taxAmount1", {})
-        if isinstance(tax1_data, dict) and tax1_data.get("amount"):
-            tax_amount1 = Decimal(str(tax1_data["amount"]))
-        elif tax1_data and not isinstance(tax1_data, dict):
-            tax_amount1 = Decimal(str(tax1_data))
-
-        tax_amount2 = None
-        tax2_data = data.get("taxAmount2", {})
-        if isinstance(tax2_data, dict) and tax2_data.get("amount"):
-            tax_amount2 = Decimal(str(tax2_data["amount"]))
-        elif tax2_data and not isinstance(tax2_data, dict):
-            tax_amount2 = Decimal(str(tax2_data))
-
-        return Expense(
-            expenseid=data["expenseid"],
-            amount=amount,
-            currency_code=currency_code,
-            date=data.get("date", ""),
-            vendor=data.get("vendor"),
-            categoryid=data.get("categoryid"),
-            staffid=data.get("staffid"),
-            clientid=data.get("clientid"),
-            projectid=data.get("projectid"),
-            notes=data.get("notes"),
-            status=data.get("status", 0),
-            taxAmount1=tax_amount1,
-            taxAmount2=tax_amount2,
-            taxName1=data.get("taxName1"),
-            taxName2=data.get("taxName2"),
-            invoiceid=data.get("invoiceid"),
-            vis_state=data.get("vis_state", 0),
-        )
-
     def list(
         self,
         date_min: Optional[str] = None,
@@ -85,42 +135,66 @@ class ExpensesAPI:
         Returns:
             Tuple of (expenses list, total count)
         """
-        params = {
-            "page": page,
-            "per_page": per_page,
-        }
-
-        if date_min is not None:
-            params["search[date_min]"] = date_min
+        params = self._list_params(date_min, date_max, categoryid, vendor, status, page, per_page)
+        url = self.client.accounting_url("expenses/expenses")
+        return self._list_at(url, params)
 
-        if date_max is not None:
-            params["search[date_max]"] = date_max
+    def _list_params(
+        self,
+        date_min: Optional[str],
+        date_max: Optional[str],
+        categoryid: Optional[int],
+        vendor: Optional[str],
+        status: Optional[int],
+        page: int,
+        per_page: int,
+    ) -> dict:
+        """Build query params for an expenses listing."""
+        filters = (
+            ("search[date_min]", date_min),
+            ("search[date_max]", date_max),
+            ("search[categoryid]", categoryid),
+            ("search[vendor]", vendor),
+            ("search[status]", status),
+        )
+        params = {"page": page, "per_page": per_page}
+        params.update({key: value for key, value in filters if value is not None})
 
-        if categoryid is not None:
-            params["search[categoryid]"] = categoryid
+        return params
 
-        if vendor is not None:
-            params["search[vendor]"] = vendor
+    def _list_at(self, url: str, params: dict) -> tuple[list[Expense], int]:
+        """Fetch and parse one page of expenses from a prebuilt URL and params."""
+        return _parse_expense_page(self.client.get(url, params=params))
 
-        if status is not None:
-            params["search[status]"] = status
+    def iter_all(
+        self,
+        date_min: Optional[str] = None,
+        date_max: Optional[str] = None,
+        categoryid: Optional[int] = None,
+        vendor: Optional[str] = None,
+        status: Optional[int] = None,
+    ) -> Iterator[Expense]:
+        """Iterate over all expenses, yielding each page as soon as it's parsed.
 
+        The first page reports the total count; the remaining pages are
+        fetched concurrently in windows of MAX_CONCURRENT_REQUESTS, so at most
+        one window of decoded responses is held in memory at a time.
+        """
+        per_page = 100
         url = self.client.accounting_url("expenses/expenses")
-        response = self.client.get(url, params=params)
+        params = self._list_params(date_min, date_max, categoryid, vendor, status, 1, per_page)
 
-        result = response.get("response", {}).get("result", {})
-        expenses_data = result.get("expenses", [])
-        total = result.get("total", len(expenses_data))
+        expenses, total = self._list_at(url, params)
+        yield from expenses
+        if not expenses:
+            return
 
-        expenses = []
-        for exp_data in expenses_data:
-            try:
-                expense = self._parse_expense(exp_data)
-                expenses.append(expense)
-            except (KeyError, ValueError):
-                continue
-
-        return expenses, total
+        last_page = math.ceil(total / per_page)
+        window = self.client.MAX_CONCURRENT_REQUESTS
+        for start in range(2, last_page + 1, window):
+            pages = range(start, min(start + window, last_page + 1))
+            for response in self.client.get_pages(url, params, pages):
+                yield from _parse_expense_page(response)[0]
 
     def list_all(
         self,
@@ -131,84 +205,55 @@ class ExpensesAPI:
         status: Optional[int] = None,
     ) -> list[Expense]:
         """List all expenses (paginated automatically)."""
-        all_expenses = []
-        page = 1
-        per_page = 100
-
-        while True:
-            expenses, total = self.list(
-                date_min=date_min,
-                date_max=date_max,
-                categoryid=categoryid,
-                vendor=vendor,
-                status=status,
-                page=page,
-                per_page=per_page,
-            )
-
-            all_expenses.extend(expenses)
-
-            if len(all_expenses) >= total or not expenses:
-                break
-
-            page += 1
-
-        return all_expenses
+        return list(self.iter_all(date_min, date_max, categoryid, vendor, status))
 
     def get(self, expense_id: int) -> Optional[Expense]:
         """Get a single expense by ID."""
         url = self.client.accounting_url(f"expenses/expenses/{expense_id}")
         try:
             response = self.client.get(url)
-            exp_data = response.get("response", {}).get("result", {}).get("expense", {})
+            exp_data = unwrap_result(response).get("expense", {})
 
             if not exp_data:
                 return None
 
-            return self._parse_expense(exp_data)
+            return _parse_expense(exp_data)
         except Exception:
             return None
 
+    def _categories_cache_name(self) -> str:
+        """Cache file name for this account's expense categories."""
+        account_id, _ = self.client.ensure_account_info()
+        return f"categories-{account_id}.json"
+
     def list_categories(self) -> list[ExpenseCategory]:
-        """List all expense categories (cached)."""
+        """List all expense categories.
+
+        Cached per instance and on disk for CATEGORIES_CACHE_TTL seconds, so
+        separate CLI runs don't re-paginate the categories endpoint.
+        """
         if self._categories_cache is not None:
             return list(self._categories_cache.values())
 
-        all_categories = []
-        page = 1
-        per_page = 100
-
-        while True:
-            params = {
-                "page": page,
-                "per_page": per_page,
-            }
+        cache_name = self._categories_cache_name()
+        cached = load_cache(cache_name, self.CATEGORIES_CACHE_TTL)
+        if cached is not None:
+            all_categories = [ExpenseCategory.model_validate(c) for c in cached]
+            self._categories_cache = {cat.id: cat for cat in all_categories}
+            return all_categories
 
-            url = self.client.accounting_url("expenses/categories")
-            response = self.client.get(url, params=params)
-
-            result = response.get("response", {}).get("result", {})
-            categories_data = result.get("categories", [])
-            total = result.get("total", len(categories_data))
-
-            for cat_data in categories_data:
-                try:
-                    category = ExpenseCategory(
-                        categoryid=cat_data["categoryid"],
-                        category=cat_data.get("category", ""),
-                        is_cogs=cat_data.get("is_cogs", False),
-                        vis_state=cat_data.get("vis_state", 0),
-                    )
-                    all_categories.append(category)
-                except (KeyError, ValueError):
-                    continue
-
-            if len(all_categories) >= total or not categories_data:
-                break
+        per_page = 100
+        url = self.client.accounting_url("expenses/categories")
+        params = {"page": 1, "per_page": per_page}
 
-            page += 1
+        all_categories, total = _parse_category_page(self.client.get(url, params=params))
+        if all_categories:
+            last_page = math.ceil(total / per_page)
+            for response in self.client.get_pages(url, params, range(2, last_page + 1)):
+                all_categories.extend(_parse_category_page(response)[0])
 
         self._categories_cache = {cat.id: cat for cat in all_categories}
+        save_cache(cache_name, [cat.model_dump(by_alias=True) for cat in all_categories])
         return all_categories
 
     def get_category_name(self, category_id: int) -> str:
@@ -218,6 +263,11 @@ class ExpensesAPI:
             return self._categories_cache[category_id].name
         return f"Category {category_id}"
 
+    def get_category_names(self, category_ids: Iterable[int]) -> dict[int, str]:
+        """Get category names for a batch of IDs, one lookup per distinct ID."""
+        return {category_id: self.get_category_name(category_id) for category_id in set(category_ids)}
+
     def clear_cache(self) -> None:
-        """Clear cached category data."""
+        """Clear cached category data, including the on-disk cache."""
         self._categories_cache = None
+        delete_cache(self._categories_cache_name())
@@ -1,16 +1,145 @@
 """Invoices and payments API module."""
 
+import math
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Optional
 
 from ..models import Client, Invoice, InvoiceLine, Payment
-from .client import FreshBooksClient
+from .client import FreshBooksClient, unwrap_result
+
+
+@lru_cache(maxsize=4096)
+def _to_decimal(text: str) -> Decimal:
+    """Parse a money string to Decimal, memoized since amounts repeat heavily."""
+    return Decimal(text)
+
+
+def _money(value: Any) -> Optional[Decimal]:
+    """Convert an API money value (scalar or {"amount": ...} dict) to Decimal.
+
+    Returns None for missing or empty values.
+    """
+    if not value:
+        return None
+    if type(value) is dict:
+        value = value["amount"]
+    return _to_decimal(str(value))
+
+
+_INCLUDES = {
+    (False, False): None,
+    (True, False): "lines",
+    (False, True): "payments",
+    (True, True): "lines,payments",
+}
+
+_INVOICE_MONEY_FIELDS = ("amount", "paid", "outstanding", "discount_value")
+
+
+def _extract_money(data: dict, keys: tuple[str, ...]) -> list[Optional[Decimal]]:
+    """Convert several money fields of one row with a single dispatch loop."""
+    get = data.get
+    return [_money(get(key)) for key in keys]
+
+
+def _parse_line(line: dict) -> InvoiceLine:
+    """Parse an invoice line item from API response."""
+    get = line.get
+    return InvoiceLine(
+        lineid=get("lineid"),
+        name=get("name"),
+        description=get("description"),
+        qty=_to_decimal(str(get("qty", 1))),
+        unit_cost=_money(get("unit_cost")),
+        amount=_money(get("amount")),
+        type=get("type", 0),
+    )
+
+
+def _parse_payment(pay: dict) -> Payment:
+    """Parse a payment record from API response."""
+    get = pay.get
+    amount = _money(get("amount"))
+    return Payment(
+        paymentid=pay["paymentid"],
+        invoiceid=pay["invoiceid"],
+        amount=amount if amount is not None else Decimal("0"),
+        date=get("date", ""),
+        type=get("type"),
+        note=get("note"),
+        gateway=get("gateway"),
+    )
+
+
+def _parse_invoice(
+    inv_data: dict, include_lines: bool = True, include_payments: bool = True
+) -> Invoice:
+    """Parse an invoice from API response.
+
+    Lines and payments are only parsed when the corresponding include flag
+    was requested; otherwise they are left empty.
+    """
+    get = inv_data.get
+    amount, paid, outstanding, discount_value = _extract_money(inv_data, _INVOICE_MONEY_FIELDS)
+    return Invoice(
+        invoiceid=inv_data["invoiceid"],
+        invoice_number=get("invoice_number"),
+        customerid=inv_data["customerid"],
+        create_date=get("create_date", ""),
+        due_date=get("due_date"),
+        currency_code=get("currency_code", "USD"),
+        status=get("status", 1),
+        v3_status=get("v3_status"),
+        amount=amount,
+        paid=paid,
+        outstanding=outstanding,
+        discount_value=discount_value,
+        fname=get("fname"),
+        lname=get("lname"),
+        organization=get("organization"),
+        lines=[_parse_line(line) for line in get("lines", ())] if include_lines else [],
+        payments=[_parse_payment(pay) for pay in get("payments", ())] if include_payments else [],
+    )
+
+
+def _parse_client_page(response: dict[str, Any]) -> tuple[list[Client], int]:
+    """Parse one page of a clients listing into (clients, total)."""
+    result = unwrap_result(response)
+    clients_data = result.get("clients", [])
+    total = result.get("total", len(clients_data))
+
+    clients = []
+    for c in clients_data:
+        userid = c.get("userid")
+        if userid is None:
+            continue
+        try:
+            client = Client(
+                userid=userid,
+                fname=c.get("fname"),
+                lname=c.get("lname"),
+                organization=c.get("organization"),
+                email=c.get("email"),
+                currency_code=c.get("currency_code", "USD"),
+            )
+            clients.append(client)
+        except ValueError:
+            continue
+
+    return clients, total
 
 
 class InvoicesAPI:
     """API for querying invoices, payments, and clients."""
 
+    __slots__ = ("client", "_clients_cache")
+
+    # Paid and outstanding amounts change with every payment, so listings are
+    # only reused briefly; after that they are revalidated by ETag.
+    CACHE_TTL = 5
+
     def __init__(self, client: FreshBooksClient):
         self.client = client
         self._clients_cache: Optional[dict[int, Client]] = None
@@ -25,6 +154,7 @@ class InvoicesAPI:
         include_payments: bool = True,
         page: int = 1,
         per_page: int = 100,
+        invoice_number: Optional[str] = None,
     ) -> tuple[list[Invoice], int]:
         """
         List invoices with optional filters.
@@ -38,116 +168,70 @@ class InvoicesAPI:
             include_payments: Include payments
             page: Page number
             per_page: Results per page
+            invoice_number: Filter by invoice number
 
         Returns:
             Tuple of (invoices list, total count)
         """
-        params = {
-            "page": page,
-            "per_page": per_page,
-        }
-
-        includes = []
-        if include_lines:
-            includes.append("lines")
-        if include_payments:
-            includes.append("payments")
-        if includes:
-            params["include"] = ",".join(includes)
-
-        if customer_id is not None:
-            params["search[customerid]"] = customer_id
-
-        if status is not None:
-            params["search[v3_status]"] = status
-
-        if date_min is not None:
-            params["search[date_min]"] = date_min
-
-        if date_max is not None:
-            params["search[date_max]"] = date_max
-
         url = self.client.accounting_url("invoices/invoices")
-        response = self.client.get(url, params=params)
+        params = self._list_params(
+            customer_id, status, date_min, date_max, include_lines, include_payments, page, per_page, invoice_number
+        )
+        return self._list_at(url, params, include_lines, include_payments)
+
+    @staticmethod
+    def _list_params(
+        customer_id: Optional[int],
+        status: Optional[str],
+        date_min: Optional[str],
+        date_max: Optional[str],
+        include_lines: bool,
+        include_payments: bool,
+        page: int,
+        per_page: int,
+        invoice_number: Optional[str],
+    ) -> dict:
+        """Build query params for an invoices listing."""
+        params = {"page": page, "per_page": per_page}
+
+        include = _INCLUDES[bool(include_lines), bool(include_payments)]
+        if include:
+            params["include"] = include
+
+        filters = (
+            ("search[customerid]", customer_id),
+            ("search[v3_status]", status),
+            ("search[date_min]", date_min),
+            ("search[date_max]", date_max),
+            ("search[invoice_number]", invoice_number),
+        )
+        params.update({key: value for key, value in filters if value is not None})
+
+        return params
+
+    def _list_at(
+        self, url: str, params: dict, include_lines: bool, include_payments: bool
+    ) -> tuple[list[Invoice], int]:
+        """Fetch and parse one page of invoices from a prebuilt URL and params."""
+        response = self.client.get(url, params=params, cache_ttl=self.CACHE_TTL)
 
-        result = response.get("response", {}).get("result", {})
+        result = unwrap_result(response)
         invoices_data = result.get("invoices", [])
         total = result.get("total", len(invoices_data))
 
         invoices = []
         for inv_data in invoices_data:
+            if inv_data.get("invoiceid") is None or inv_data.get("customerid") is None:
+                continue
             try:
-                lines = []
-                for line in inv_data.get("lines", []):
-                    lines.append(InvoiceLine(
-                        lineid=line.get("lineid"),
-                        name=line.get("name"),
-                        description=line.get("description"),
-                        qty=Decimal(str(line.get("qty", 1))),
-                        unit_cost=Decimal(str(line["unit_cost"]["amount"])) if line.get("unit_cost") else None,
-                        amount=Decimal(str(line["amount"]["amount"])) if line.get("amount") else None,
-                        type=line.get("type", 0),
-                    ))
-
-                payments = []
-                for pay in inv_data.get("payments", []):
-                    payments.append(Payment(
-                        paymentid=pay["paymentid"],
-                        invoiceid=pay["invoiceid"],
-                        amount=Decimal(str(pay["amount"]["amount"])) if isinstance(pay.get("amount"), dict) else Decimal(str(pay.get("amount", 0))),
-                        date=pay.get("date", ""),
-                        type=pay.get("type"),
-                        note=pay.get("note"),
-                        gateway=pay.get("gateway"),
-                    ))
-
-                amount_val = None
-                if inv_data.get("amount"):
-                    if isinstance(inv_data["amount"], dict):
-                        amount_val = Decimal(str(inv_data["amount"]["amount"]))
-                    else:
-                        amount_val = Decimal(str(inv_data["amount"]))
-
-                paid_val = None
-                if inv_data.get("paid"):
-                    if isinstance(inv_data["paid"], dict):
-                        paid_val = Decimal(str(inv_data["paid"]["amount"]))
-                    else:
-                        paid_val = Decimal(str(inv_data["paid"]))
-
-                outstanding_val = None
-                if inv_data.get("outstanding"):
-                    if isinstance(inv_data["outstanding"], dict):
-                        outstanding_val = Decimal(str(inv_data["outstanding"]["amount"]))
-                    else:
-                        outstanding_val = Decimal(str(inv_data["outstanding"]))
-
-                invoice = Invoice(
-                    invoiceid=inv_data["invoiceid"],
-                    invoice_number=inv_data.get("invoice_number"),
-                    customerid=inv_data["customerid"],
-                    create_date=inv_data.get("create_date", ""),
-                    due_date=inv_data.get("due_date"),
-                    currency_code=inv_data.get("currency_code", "USD"),
-                    status=inv_data.get("status", 1),
-                    v3_status=inv_data.get("v3_status"),
-                    amount=amount_val,
-                    paid=paid_val,
-                    outstanding=outstanding_val,
-                    discount_value=Decimal(str(inv_data["discount_value"])) if inv_data.get("discount_value") else None,
-                    fname=inv_data.get("fname"),
-                    lname=inv_data.get("lname"),
-                    organization=inv_data.get("organization"),
-                    lines=lines,
-                    payments=payments,
-                )
-                invoices.append(invoice)
-            except (KeyError, ValueError) as e:
+                invoices.append(_parse_invoice(inv_data, include_lines, include_payments))
+            except (KeyError, ValueError):
+                # KeyError: an included payment is missing its IDs
                 continue
 
         return invoices, total
 
-    def list_all_invoices(
+    def iter_all_invoices(
         self,
         customer_id: Optional[int] = None,
         status: Optional[str] = None,
@@ -155,152 +239,84 @@ class InvoicesAPI:
         date_max: Optional[str] = None,
         include_lines: bool = False,
         include_payments: bool = True,
-    ) -> list[Invoice]:
-        """List all invoices (paginated automatically)."""
-        all_invoices = []
-        page = 1
-        per_page = 100
+        invoice_number: Optional[str] = None,
+    ) -> Iterator[Invoice]:
+        """Iterate over all invoices, yielding each page as soon as it's parsed.
 
-        while True:
-            invoices, total = self.list_invoices(
-                customer_id=customer_id,
-                status=status,
-                date_min=date_min,
-                date_max=date_max,
-                include_lines=include_lines,
-                include_payments=include_payments,
-                page=page,
-                per_page=per_page,
-            )
+        The first page reports the total count; the remaining pages are
+        fetched concurrently in windows of MAX_CONCURRENT_REQUESTS, so callers
+        that stop early never request the rest.
+        """
+        per_page = 100
+        url = self.client.accounting_url("invoices/invoices")
+        params = self._list_params(
+            customer_id, status, date_min, date_max, include_lines, include_payments, 1, per_page, invoice_number
+        )
 
-            all_invoices.extend(invoices)
+        def fetch_page(page: int) -> tuple[list[Invoice], int]:
+            return self._list_at(url, {**params, "page": page}, include_lines, include_payments)
 
-            if len(all_invoices) >= total or not invoices:
-                break
+        invoices, total = fetch_page(1)
+        yield from invoices
+        if not invoices:
+            return
 
-            page += 1
+        last_page = math.ceil(total / per_page)
+        window = self.client.MAX_CONCURRENT_REQUESTS
+        for start in range(2, last_page + 1, window):
+            pages = range(start, min(start + window, last_page + 1))
+            for invoices, _ in self.client.map_concurrent(fetch_page, pages):
+                yield from invoices
 
-        return all_invoices
+    def list_all_invoices(
+        self,
+        customer_id: Optional[int] = None,
+        status: Optional[str] = None,
+        date_min: Optional[str] = None,
+        date_max: Optional[str] = None,
+        include_lines: bool = False,
+        include_payments: bool = True,
+        invoice_number: Optional[str] = None,
+    ) -> list[Invoice]:
+        """List all invoices (paginated automatically)."""
+        return list(self.iter_all_invoices(
+            customer_id=customer_id,
+            status=status,
+            date_min=date_min,
+            date_max=date_max,
+            include_lines=include_lines,
+            include_payments=include_payments,
+            invoice_number=invoice_number,
+        ))
 
     def get_invoice(self, invoice_id: int, include_lines: bool = True, include_payments: bool = True) -> Optional[Invoice]:
         """Get a single invoice by ID."""
-        params = {}
-        includes = []
-        if include_lines:
-            includes.append("lines")
-        if include_payments:
-            includes.append("payments")
-        if includes:
-            params["include"] = ",".join(includes)
+        include = _INCLUDES[bool(include_lines), bool(include_payments)]
+        params = {"include": include} if include else {}
 
         url = self.client.accounting_url(f"invoices/invoices/{invoice_id}")
         try:
             response = self.client.get(url, params=params)
-            inv_data = response.get("response", {}).get("result", {}).get("invoice", {})
+            inv_data = unwrap_result(response).get("invoice", {})
 
             if not inv_data:
                 return None
 
-            lines = []
-            for line in inv_data.get("lines", []):
-                lines.append(InvoiceLine(
-                    lineid=line.get("lineid"),
-                    name=line.get("name"),
-                    description=line.get("description"),
-                    qty=Decimal(str(line.get("qty", 1))),
-                    unit_cost=Decimal(str(line["unit_cost"]["amount"])) if line.get("unit_cost") else None,
-                    amount=Decimal(str(line["amount"]["amount"])) if line.get("amount") else None,
-                    type=line.get("type", 0),
-                ))
-
-            payments = []
-            for pay in inv_data.get("payments", []):
-                payments.append(Payment(
-                    paymentid=pay["paymentid"],
-                    invoiceid=pay["invoiceid"],
-                    amount=Decimal(str(pay["amount"]["amount"])) if isinstance(pay.get("amount"), dict) else Decimal(str(pay.get("amount", 0))),
-                    date=pay.get("date", ""),
-                    type=pay.get("type"),
-                    note=pay.get("note"),
-                    gateway=pay.get("gateway"),
-                ))
-
-            amount_val = None
-            if inv_data.get("amount"):
-                if isinstance(inv_data["amount"], dict):
-                    amount_val = Decimal(str(inv_data["amount"]["amount"]))
-                else:
-                    amount_val = Decimal(str(inv_data["amount"]))
-
-            paid_val = None
-            if inv_data.get("paid"):
-                if isinstance(inv_data["paid"], dict):
-                    paid_val = Decimal(str(inv_data["paid"]["amount"]))
-                else:
-                    paid_val = Decimal(str(inv_data["paid"]))
-
-            outstanding_val = None
-            if inv_data.get("outstanding"):
-                if isinstance(inv_data["outstanding"], dict):
-                    outstanding_val = Decimal(str(inv_data["outstanding"]["amount"]))
-                else:
-                    outstanding_val = Decimal(str(inv_data["outstanding"]))
-
-            return Invoice(
-                invoiceid=inv_data["invoiceid"],
-                invoice_number=inv_data.get("invoice_number"),
-                customerid=inv_data["customerid"],
-                create_date=inv_data.get("create_date", ""),
-                due_date=inv_data.get("due_date"),
-                currency_code=inv_data.get("currency_code", "USD"),
-                status=inv_data.get("status", 1),
-                v3_status=inv_data.get("v3_status"),
-                amount=amount_val,
-                paid=paid_val,
-                outstanding=outstanding_val,
-                fname=inv_data.get("fname"),
-                lname=inv_data.get("lname"),
-                organization=inv_data.get("organization"),
-                lines=lines,
-                payments=payments,
-            )
+            return _parse_invoice(inv_data, include_lines, include_payments)
         except Exception:
             return None
 
     def list_clients(self) -> list[Client]:
-        """List all clients."""
+        """List all clients, fetching pages after the first concurrently."""
+        per_page = 100
         url = self.client.accounting_url("users/clients")
-        params = {"per_page": 100}
+        params = {"page": 1, "per_page": per_page}
 
-        all_clients = []
-        page = 1
-
-        while True:
-            params["page"] = page
-            response = self.client.get(url, params=params)
-
-            result = response.get("response", {}).get("result", {})
-            clients_data = result.get("clients", [])
-            total = result.get("total", len(clients_data))
-
-            for c in clients_data:
-                try:
-                    client = Client(
-                        userid=c["userid"],
-                        fname=c.get("fname"),
-                        lname=c.get("lname"),
-                        organization=c.get("organization"),
-                        email=c.get("email"),
-                        currency_code=c.get("currency_code", "USD"),
-                    )
-                    all_clients.append(client)
-                except (KeyError, ValueError):
-                    continue
-
-            if len(all_clients) >= total or not clients_data:
-                break
-
-            page += 1
+        all_clients, total = _parse_client_page(self.client.get(url, params=params))
+        if all_clients:
+            last_page = math.ceil(total / per_page)
+            for response in self.client.get_pages(url, params, range(2, last_page + 1)):
+                all_clients.extend(_parse_client_page(response)[0])
 
         return all_clients
 
@@ -320,6 +336,10 @@ class InvoicesAPI:
             return clients[customer_id].display_name
         return f"Client {customer_id}"
 
+    def get_client_names(self, customer_ids: Iterable[int]) -> dict[int, str]:
+        """Get client display names for a batch of IDs, one lookup per distinct ID."""
+        return {customer_id: self.get_client_name(customer_id) for customer_id in set(customer_ids)}
+
     def list_payments(
         self,
         invoice_id: Optional[int] = None,
@@ -338,25 +358,17 @@ class InvoicesAPI:
         url = self.client.accounting_url("payments/payments")
         response = self.client.get(url, params=params)
 
-        result = response.get("response", {}).get("result", {})
+        result = unwrap_result(response)
         payments_data = result.get("payments", [])
         total = result.get("total", len(payments_data))
 
         payments = []
         for pay in payments_data:
+            if pay.get("paymentid") is None or pay.get("invoiceid") is None:
+                continue
             try:
-                amount = Decimal(str(pay["amount"]["amount"])) if isinstance(pay.get("amount"), dict) else Decimal(str(pay.get("amount", 0)))
-                payment = Payment(
-                    paymentid=pay["paymentid"],
-                    invoiceid=pay["invoiceid"],
-                    amount=amount,
-                    date=pay.get("date", ""),
-                    type=pay.get("type"),
-                    note=pay.get("note"),
-                    gateway=pay.get("gateway"),
-                )
-                payments.append(payment)
-            except (KeyError, ValueError):
+                payments.append(_parse_payment(pay))
+            except ValueError:
                 continue
 
         return payments, total
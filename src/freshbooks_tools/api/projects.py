@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, Optional
 
 from ..models import Project
 from .client import FreshBooksClient
@@ -11,9 +11,13 @@ from .client import FreshBooksClient
 class ProjectsAPI:
     """API for querying projects."""
 
+    __slots__ = ("client", "_projects_cache", "_projects_by_id", "_project_titles_lower")
+
     def __init__(self, client: FreshBooksClient):
         self.client = client
         self._projects_cache: Optional[list[Project]] = None
+        self._projects_by_id: Optional[dict[int, Project]] = None
+        self._project_titles_lower: Optional[list[tuple[str, Project]]] = None
 
     def list(self, include_internal: bool = False) -> list[Project]:
         """List all projects, cached."""
@@ -25,6 +29,8 @@ class ProjectsAPI:
             projects_data = response.get("projects", [])
             projects = [Project.from_api(p) for p in projects_data]
             self._projects_cache = projects
+            self._projects_by_id = {p.id: p for p in projects}
+            self._project_titles_lower = [(p.title.lower(), p) for p in projects]
 
         if include_internal:
             return projects
@@ -32,17 +38,31 @@ class ProjectsAPI:
 
     def find_by_name(self, fragment: str, include_internal: bool = False) -> list[Project]:
         """Find projects matching a name fragment (case-insensitive)."""
-        projects = self.list(include_internal=include_internal)
+        if self._project_titles_lower is None:
+            self.list(include_internal=True)
         fragment_lower = fragment.lower()
-        return [p for p in projects if fragment_lower in p.title.lower()]
+        return [
+            p
+            for title_lower, p in self._project_titles_lower
+            if fragment_lower in title_lower and (include_internal or not p.internal)
+        ]
 
     def get_by_id(self, project_id: int) -> Optional[Project]:
         """Get a project by ID from cache."""
-        projects = self.list(include_internal=True)
-        for p in projects:
-            if p.id == project_id:
-                return p
-        return None
+        if self._projects_by_id is None:
+            self.list(include_internal=True)
+        return self._projects_by_id.get(project_id)
+
+    def get_by_ids(self, project_ids: Iterable[int]) -> dict[int, Project]:
+        """Get the known projects among project_ids, indexed by ID.
+
+        Served from the one cached project listing, so resolving many IDs
+        costs at most a single request.
+        """
+        if self._projects_by_id is None:
+            self.list(include_internal=True)
+        projects_by_id = self._projects_by_id
+        return {pid: projects_by_id[pid] for pid in set(project_ids) if pid in projects_by_id}
 
     def get_with_services(self, project_id: int) -> Optional[Project]:
         """Fetch a project by ID with its associated services."""
@@ -56,3 +76,5 @@ class ProjectsAPI:
     def clear_cache(self) -> None:
         """Clear cached project data."""
         self._projects_cache = None
+        self._projects_by_id = None
+        self._project_titles_lower = None
@@ -1,7 +1,8 @@
 """Rate resolution module for billable and cost rates."""
 
 from decimal import Decimal
-from typing import Optional
+from functools import partial
+from typing import Iterable, Optional
 
 from ..config import RatesConfig
 from ..models import Service, ServiceRate
@@ -12,6 +13,15 @@ from .team import TeamAPI
 class RatesAPI:
     """API for resolving billable and cost rates."""
 
+    __slots__ = (
+        "client",
+        "team_api",
+        "rates_config",
+        "_services_cache",
+        "_service_rates_cache",
+        "_team_member_rates_cache",
+    )
+
     def __init__(self, client: FreshBooksClient, team_api: TeamAPI, rates_config: RatesConfig):
         self.client = client
         self.team_api = team_api
@@ -58,17 +68,20 @@ class RatesAPI:
 
         services = []
         for s in services_data:
+            service_id, business_id, name = s.get("id"), s.get("business_id"), s.get("name")
+            if service_id is None or business_id is None or name is None:
+                continue
             try:
                 service = Service(
-                    id=s["id"],
-                    business_id=s["business_id"],
-                    name=s["name"],
+                    id=service_id,
+                    business_id=business_id,
+                    name=name,
                     billable=s.get("billable", True),
                     project_default=s.get("project_default", False),
                     vis_state=s.get("vis_state", 0),
                 )
                 services.append(service)
-            except (KeyError, ValueError):
+            except ValueError:
                 continue
 
         return services
@@ -101,6 +114,18 @@ class RatesAPI:
         self._service_rates_cache[service_id] = None
         return None
 
+    def warm_service_rates(self, service_ids: Iterable[Optional[int]]) -> None:
+        """Prefetch team member rates and the given service rates.
+
+        Uncached service rates are fetched concurrently, so resolving rates
+        for a batch of time entries costs roughly one round-trip instead of
+        one per distinct service.
+        """
+        uncached = {sid for sid in service_ids if sid and sid not in self._service_rates_cache}
+        tasks = [self.get_team_member_rates]
+        tasks.extend(partial(self.get_service_rate, sid) for sid in uncached)
+        self.client.map_concurrent(lambda task: task(), tasks)
+
     def get_service_name(self, service_id: int) -> str:
         """Get the name of a service."""
         services = self.get_services_by_id()
@@ -108,6 +133,10 @@ class RatesAPI:
             return services[service_id].name
         return f"Service {service_id}"
 
+    def get_service_names(self, service_ids: Iterable[int]) -> dict[int, str]:
+        """Get names for a batch of service IDs, one lookup per distinct ID."""
+        return {service_id: self.get_service_name(service_id) for service_id in set(service_ids)}
+
     def get_staff_rate(self, identity_id: int) -> Optional[Decimal]:
         """Get the rate from staff record (deprecated API)."""
         staff = self.team_api.get_staff_by_id()
@@ -175,6 +204,20 @@ class RatesAPI:
 
         return self.rates_config.default_cost_rate
 
+    def get_billable_rates(
+        self, pairs: Iterable[tuple[int, Optional[int]]]
+    ) -> dict[tuple[int, Optional[int]], Optional[Decimal]]:
+        """Resolve billable rates for distinct (identity_id, service_id) pairs.
+
+        Lets callers with many time entries resolve each combination once
+        and then index the result per entry.
+        """
+        return {pair: self.get_billable_rate(*pair) for pair in set(pairs)}
+
+    def get_cost_rates(self, identity_ids: Iterable[int]) -> dict[int, Optional[Decimal]]:
+        """Resolve cost rates for distinct identity_ids."""
+        return {identity_id: self.get_cost_rate(identity_id) for identity_id in set(identity_ids)}
+
     def clear_cache(self) -> None:
         """Clear cached rate data."""
         self._services_cache = None
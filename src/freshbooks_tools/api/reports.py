@@ -1,11 +1,26 @@
 """Reports API module for FreshBooks financial reports."""
 
-import calendar
+from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, Optional
 
-from ..models import AccountAgingReport, ProfitLossReport
-from .client import FreshBooksClient
+from ..models import AccountAgingReport, ProfitLossIncomePeriod, ProfitLossReport
+from .client import FreshBooksClient, unwrap_result
+
+
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(year: int) -> bool:
+    """Gregorian leap year test."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Number of days in a month, without going through calendar.monthrange."""
+    if month == 2 and _is_leap(year):
+        return 29
+    return _MONTH_DAYS[month - 1]
 
 
 def calculate_dso(
@@ -30,6 +45,48 @@ def calculate_dso(
     return dso.quantize(Decimal("0.1"))
 
 
+def calculate_period_dso(
+    ar_balance: Decimal,
+    periods: Iterable[ProfitLossIncomePeriod],
+    resolution: str,
+) -> list[Optional[Decimal]]:
+    """
+    Calculate DSO for every income period of a P&L report in one pass.
+
+    Period lengths are computed once per distinct period start, and the
+    Decimal constants are shared across rows, so long multi-year rollups
+    avoid repeating per-row setup.
+
+    Args:
+        ar_balance: Current accounts receivable balance
+        periods: Income periods from a ProfitLossReport
+        resolution: "m" (monthly), "q" (quarterly), or "y" (yearly)
+
+    Returns:
+        DSO per period, in input order (None where revenue is zero/negative)
+    """
+    zero = Decimal(0)
+    step = Decimal("0.1")
+    days_by_start: dict[tuple[int, int], Decimal] = {}
+    results: list[Optional[Decimal]] = []
+
+    for period in periods:
+        revenue = period.total.amount
+        if revenue <= zero:
+            results.append(None)
+            continue
+
+        start = date.fromisoformat(period.start_date[:10])
+        key = (start.year, start.month)
+        days = days_by_start.get(key)
+        if days is None:
+            days = days_by_start[key] = Decimal(get_days_in_period(start.year, start.month, resolution))
+
+        results.append(((ar_balance / revenue) * days).quantize(step))
+
+    return results
+
+
 def get_days_in_period(year: int, month: int, resolution: str) -> int:
     """
     Get number of days in a period based on resolution.
@@ -43,15 +100,16 @@ def get_days_in_period(year: int, month: int, resolution: str) -> int:
         Number of days in the period
     """
     if resolution == "m":
-        return calendar.monthrange(year, month)[1]
+        return _days_in_month(year, month)
     elif resolution == "q":
         quarter_month = ((month - 1) // 3) * 3 + 1
-        return sum(
-            calendar.monthrange(year, quarter_month + i)[1]
-            for i in range(3)
+        return (
+            _days_in_month(year, quarter_month)
+            + _days_in_month(year, quarter_month + 1)
+            + _days_in_month(year, quarter_month + 2)
         )
     elif resolution == "y":
-        return 366 if calendar.isleap(year) else 365
+        return 366 if _is_leap(year) else 365
     else:
         raise ValueError(f"Unknown resolution: {resolution}")
 
@@ -59,6 +117,14 @@ def get_days_in_period(year: int, month: int, resolution: str) -> int:
 class ReportsAPI:
     """API for FreshBooks financial reports."""
 
+    __slots__ = ("client",)
+
+    CACHE_TTL = 3600
+
+    # Receivables change as soon as a payment is recorded, so AR aging is
+    # only reused briefly; after that it is revalidated by ETag.
+    AR_AGING_CACHE_TTL = 5
+
     def __init__(self, client: FreshBooksClient):
         """
         Initialize ReportsAPI.
@@ -94,9 +160,9 @@ class ReportsAPI:
             params["currency_code"] = currency_code
 
         url = self.client.reports_url("accounts_aging", use_business_id=False)
-        response = self.client.get(url, params=params)
+        response = self.client.get(url, params=params, cache_ttl=self.AR_AGING_CACHE_TTL)
 
-        data = response.get("response", {}).get("result", {}).get("accounts_aging", {})
+        data = unwrap_result(response).get("accounts_aging", {})
 
         return AccountAgingReport(**data)
 
@@ -129,8 +195,8 @@ class ReportsAPI:
             params["currency_code"] = currency_code
 
         url = self.client.reports_url("profit_and_loss", use_business_id=True)
-        response = self.client.get(url, params=params)
+        response = self.client.get(url, params=params, cache_ttl=self.CACHE_TTL)
 
-        data = response.get("response", {}).get("result", {}).get("profit_and_loss", {})
+        data = unwrap_result(response).get("profit_and_loss", {})
 
         return ProfitLossReport(**data)
@@ -1,27 +1,51 @@
 """Team members and staff API module."""
 
+import sys
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 from ..models import Staff, TeamMember
-from .client import FreshBooksClient
+from .client import FreshBooksClient, unwrap_result
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values that repeat across many members (roles, companies)."""
+    return sys.intern(value) if type(value) is str else value
 
 
 class TeamAPI:
     """API for querying team members and staff."""
 
+    __slots__ = (
+        "client",
+        "_team_cache",
+        "_staff_cache",
+        "_project_members_cache",
+        "_combined_cache",
+        "_combined_has_projects",
+        "_search_index",
+        "_project_search_index",
+    )
+
     def __init__(self, client: FreshBooksClient):
         self.client = client
         self._team_cache: Optional[dict[int, TeamMember]] = None
         self._staff_cache: Optional[dict[int, Staff]] = None
         self._project_members_cache: Optional[dict[int, dict]] = None
+        self._combined_cache: Optional[dict[int, tuple[str, Optional[str]]]] = None
+        self._combined_has_projects = False
+        self._search_index: Optional[list[tuple[str, int]]] = None
+        self._project_search_index: Optional[list[tuple[str, int]]] = None
+
+    # Rosters change rarely; cached responses are revalidated by ETag after this.
+    CACHE_TTL = 3600
 
     def list_team_members(self) -> list[TeamMember]:
         """List all team members from auth API."""
         _, business_id = self.client.ensure_account_info()
         url = f"{self.client.BASE_AUTH_URL}/businesses/{business_id}/team_members"
 
-        response = self.client.get(url)
+        response = self.client.get(url, cache_ttl=self.CACHE_TTL)
         members_data = response.get("team_members", [])
 
         members = []
@@ -35,7 +59,7 @@ class TeamAPI:
                     email=member_data.get("email"),
                     job_title=member_data.get("job_title"),
                     business_id=member_data.get("business_id", business_id),
-                    business_role_name=member_data.get("business_role_name"),
+                    business_role_name=_intern(member_data.get("business_role_name")),
                     active=member_data.get("active", True),
                     identity_id=member_data.get("identity_id"),
                 )
@@ -57,44 +81,55 @@ class TeamAPI:
         members_by_id: dict[int, dict] = {}
 
         url = self.client.timetracking_url("projects")
-        response = self.client.get(url, params={"per_page": 100})
+        response = self.client.get(
+            url,
+            params={"per_page": 100, "include[]": "group.members"},
+            cache_ttl=self.CACHE_TTL,
+        )
         projects = response.get("projects", [])
 
-        for project in projects:
-            project_id = project.get("id")
-            if not project_id:
-                continue
-
-            try:
-                detail_url = self.client.timetracking_url(f"projects/{project_id}")
-                detail = self.client.get(detail_url)
-                project_data = detail.get("project", {})
-                group = project_data.get("group", {})
-                members = group.get("members", [])
-
-                for m in members:
-                    identity_id = m.get("identity_id")
-                    if identity_id and identity_id not in members_by_id:
-                        members_by_id[identity_id] = {
-                            "first_name": m.get("first_name"),
-                            "last_name": m.get("last_name"),
-                            "email": m.get("email"),
-                            "company": m.get("company"),
-                            "active": m.get("active", True),
-                            "role": m.get("role"),
-                        }
-            except Exception:
-                continue
+        # Projects listed with their group expanded need no detail request;
+        # only fall back to per-project fetches when the include was ignored.
+        missing = [p["id"] for p in projects if p.get("id") and "group" not in p]
+        fetched = iter(self.client.map_concurrent(self._fetch_project_group_members, missing))
+        member_lists = (
+            (p.get("group") or {}).get("members", []) if "group" in p else next(fetched)
+            for p in projects
+            if p.get("id")
+        )
+
+        for members in member_lists:
+            for m in members:
+                identity_id = m.get("identity_id")
+                if identity_id and identity_id not in members_by_id:
+                    members_by_id[identity_id] = {
+                        "first_name": m.get("first_name"),
+                        "last_name": m.get("last_name"),
+                        "email": m.get("email"),
+                        "company": _intern(m.get("company")),
+                        "active": m.get("active", True),
+                        "role": _intern(m.get("role")),
+                    }
 
         self._project_members_cache = members_by_id
         return members_by_id
 
+    def _fetch_project_group_members(self, project_id: int) -> list[dict]:
+        """Fetch one project's group members, or [] if the detail request fails."""
+        try:
+            detail = self.client.get(
+                self.client.timetracking_url(f"projects/{project_id}"), cache_ttl=self.CACHE_TTL
+            )
+            return detail.get("project", {}).get("group", {}).get("members", [])
+        except Exception:
+            return []
+
     def list_staff(self) -> list[Staff]:
         """List all staff from accounting API (deprecated but has rates)."""
         url = self.client.accounting_url("users/staffs")
 
-        response = self.client.get(url)
-        staff_response = response.get("response", {}).get("result", {})
+        response = self.client.get(url, cache_ttl=self.CACHE_TTL)
+        staff_response = unwrap_result(response)
         staff_data = staff_response.get("staffs", [])
 
         staff_list = []
@@ -121,90 +156,126 @@ class TeamAPI:
 
     def get_team_by_identity_id(self) -> dict[int, TeamMember]:
         """Get team members indexed by identity_id."""
-        if self._team_cache is not None:
-            return self._team_cache
-
-        members = self.list_team_members()
-        self._team_cache = {}
-
-        for member in members:
-            if member.identity_id:
-                self._team_cache[member.identity_id] = member
-
+        if self._team_cache is None:
+            self._team_cache = {m.identity_id: m for m in self.list_team_members() if m.identity_id}
         return self._team_cache
 
     def get_staff_by_id(self) -> dict[int, Staff]:
         """Get staff indexed by id (which matches identity_id)."""
-        if self._staff_cache is not None:
-            return self._staff_cache
+        if self._staff_cache is None:
+            self._staff_cache = {s.id: s for s in self.list_staff()}
+        return self._staff_cache
 
-        staff_list = self.list_staff()
-        self._staff_cache = {}
+    def _build_combined(self) -> dict[int, tuple[str, Optional[str]]]:
+        """Get (display name, email) for every team member and staff identity_id.
 
-        for staff in staff_list:
-            self._staff_cache[staff.id] = staff
+        Team members take precedence over staff. Project group members are
+        merged in later by _lookup_member, only when an id is not found here.
+        """
+        if self._combined_cache is not None:
+            return self._combined_cache
 
-        return self._staff_cache
+        # The two sources are independent requests; fetch them together.
+        team, staff = self.client.map_concurrent(
+            lambda load: load(), [self.get_team_by_identity_id, self.get_staff_by_id]
+        )
+        combined: dict[int, tuple[str, Optional[str]]] = {}
 
-    def get_team_member_name(self, identity_id: int) -> str:
-        """Get display name for a team member by identity_id."""
-        team = self.get_team_by_identity_id()
+        for staff_id, s in staff.items():
+            combined[staff_id] = (s.name, s.email)
 
-        if identity_id in team:
-            return team[identity_id].display_name
+        for identity_id, member in team.items():
+            combined[identity_id] = (member.display_name, member.email)
 
-        staff = self.get_staff_by_id()
-        if identity_id in staff:
-            return staff[identity_id].name
+        self._combined_cache = combined
+        self._combined_has_projects = False
+        return combined
 
-        project_members = self.list_project_members()
-        if identity_id in project_members:
-            m = project_members[identity_id]
-            name = f"{m.get('first_name', '')} {m.get('last_name', '')}".strip()
-            return name or m.get("email") or f"Unknown ({identity_id})"
+    def _merge_project_members(self, combined: dict[int, tuple[str, Optional[str]]]) -> None:
+        """Add project group members to combined without overriding team or staff."""
+        for identity_id, m in self.list_project_members().items():
+            if identity_id not in combined:
+                name = f"{m.get('first_name') or ''} {m.get('last_name') or ''}".strip()
+                email = m.get("email")
+                combined[identity_id] = (name or email or f"Unknown ({identity_id})", email)
+        self._combined_has_projects = True
 
-        return f"Unknown ({identity_id})"
+    def _lookup_member(self, identity_id: int) -> tuple[str, Optional[str]]:
+        """Get (display name, email) for identity_id, remembering unknown ids.
+
+        Project members are only fetched when team and staff miss the id.
+        """
+        combined = self._build_combined()
+        entry = combined.get(identity_id)
+        if entry is None and not self._combined_has_projects:
+            self._merge_project_members(combined)
+            entry = combined.get(identity_id)
+        if entry is None:
+            entry = combined[identity_id] = (f"Unknown ({identity_id})", None)
+        return entry
+
+    def get_team_member_name(self, identity_id: int) -> str:
+        """Get display name for a team member by identity_id."""
+        return self._lookup_member(identity_id)[0]
 
     def get_team_member_email(self, identity_id: int) -> Optional[str]:
         """Get email for a team member by identity_id."""
-        team = self.get_team_by_identity_id()
+        return self._lookup_member(identity_id)[1]
 
-        if identity_id in team:
-            return team[identity_id].email
+    def get_team_member_names(self, identity_ids: Iterable[int]) -> dict[int, str]:
+        """Get display names for a batch of identity_ids, one lookup per distinct id."""
+        return {identity_id: self._lookup_member(identity_id)[0] for identity_id in set(identity_ids)}
 
-        staff = self.get_staff_by_id()
-        if identity_id in staff:
-            return staff[identity_id].email
+    def _build_search_index(self) -> list[tuple[str, int]]:
+        """Get (lowercased name, identity_id) pairs for team members then staff."""
+        if self._search_index is not None:
+            return self._search_index
 
-        project_members = self.list_project_members()
-        if identity_id in project_members:
-            return project_members[identity_id].get("email")
+        index = [
+            (member.display_name.lower(), identity_id)
+            for identity_id, member in self.get_team_by_identity_id().items()
+        ]
+        index.extend((s.name.lower(), staff_id) for staff_id, s in self.get_staff_by_id().items())
 
-        return None
+        self._search_index = index
+        return index
 
-    def find_identity_by_name(self, name: str) -> Optional[int]:
-        """Find identity_id by name (case-insensitive partial match)."""
-        name_lower = name.lower()
+    def _build_project_search_index(self) -> list[tuple[str, int]]:
+        """Get (lowercased name or email, identity_id) pairs for project members."""
+        if self._project_search_index is not None:
+            return self._project_search_index
 
-        team = self.get_team_by_identity_id()
-        for identity_id, member in team.items():
-            if name_lower in member.display_name.lower():
+        index = []
+        for identity_id, m in self.list_project_members().items():
+            full_name = f"{m.get('first_name', '')} {m.get('last_name', '')}".strip().lower()
+            index.append((full_name, identity_id))
+            if m.get("email"):
+                index.append((m["email"].lower(), identity_id))
+
+        self._project_search_index = index
+        return index
+
+    @staticmethod
+    def _match_in(index: list[tuple[str, int]], name_lower: str) -> Optional[int]:
+        """Return the first identity_id whose haystack contains name_lower."""
+        for haystack, identity_id in index:
+            if name_lower in haystack:
                 return identity_id
+        return None
 
-        staff = self.get_staff_by_id()
-        for staff_id, s in staff.items():
-            if name_lower in s.name.lower():
-                return staff_id
+    def find_identity_by_name(self, name: str) -> Optional[int]:
+        """Find identity_id by name (case-insensitive partial match).
 
-        project_members = self.list_project_members()
-        for identity_id, m in project_members.items():
-            full_name = f"{m.get('first_name', '')} {m.get('last_name', '')}".strip().lower()
-            if name_lower in full_name:
-                return identity_id
-            if m.get("email") and name_lower in m["email"].lower():
-                return identity_id
+        Project members are only fetched when no team member or staff
+        name matches.
+        """
+        name_lower = name.lower()
 
-        return None
+        identity_id = self._match_in(self._build_search_index(), name_lower)
+        if identity_id is not None:
+            return identity_id
+
+        return self._match_in(self._build_project_search_index(), name_lower)
 
     def get_all_members(self) -> dict[int, dict]:
         """Get all team members/contractors from all sources.
@@ -213,8 +284,7 @@ class TeamAPI:
         """
         all_members: dict[int, dict] = {}
 
-        team = self.get_team_by_identity_id()
-        for identity_id, member in team.items():
+        for identity_id, member in self.get_team_by_identity_id().items():
             all_members[identity_id] = {
                 "first_name": member.first_name,
                 "last_name": member.last_name,
@@ -254,3 +324,7 @@ class TeamAPI:
         self._team_cache = None
         self._staff_cache = None
         self._project_members_cache = None
+        self._combined_cache = None
+        self._combined_has_projects = False
+        self._search_index = None
+        self._project_search_index = None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from datetime import datetime
 from typing import Optional
 
@@ -16,6 +17,8 @@ console = Console()
 class TimeEntriesAPI:
     """API for querying time entries."""
 
+    __slots__ = ("client",)
+
     def __init__(self, client: FreshBooksClient):
         self.client = client
 
@@ -23,6 +26,8 @@ class TimeEntriesAPI:
         """Parse time entries, returning (entries, skipped_count)."""
         entries = []
         skipped = 0
+        # Python 3.11's fromisoformat accepts the trailing "Z" directly.
+        fromisoformat = datetime.fromisoformat
 
         for entry_data in entries_data:
             try:
@@ -30,9 +35,7 @@ class TimeEntriesAPI:
                     id=entry_data["id"],
                     identity_id=entry_data["identity_id"],
                     duration=entry_data.get("duration", 0),
-                    started_at=datetime.fromisoformat(
-                        entry_data["started_at"].replace("Z", "+00:00")
-                    ),
+                    started_at=fromisoformat(entry_data["started_at"]),
                     is_logged=entry_data.get("is_logged", True),
                     client_id=entry_data.get("client_id"),
                     project_id=entry_data.get("project_id"),
@@ -82,41 +85,55 @@ class TimeEntriesAPI:
         Returns:
             Tuple of (time entries list, total count)
         """
-        params = {
-            "page": page,
-            "per_page": per_page,
-        }
-
-        if identity_id is not None:
-            params["identity_id"] = identity_id
-
-        if started_from is not None:
-            params["started_from"] = started_from.strftime("%Y-%m-%dT%H:%M:%S")
-
-        if started_to is not None:
-            params["started_to"] = started_to.strftime("%Y-%m-%dT%H:%M:%S")
-
-        if billable is not None:
-            params["billable"] = str(billable).lower()
-
-        if billed is not None:
-            params["billed"] = str(billed).lower()
-
-        if client_id is not None:
-            params["client_id"] = client_id
-
-        if project_id is not None:
-            params["project_id"] = project_id
-
-        if include_team:
-            params["team"] = "true"
-
-        if include_deleted:
-            params["include_deleted"] = "true"
-
+        params = self._list_params(
+            identity_id,
+            started_from,
+            started_to,
+            billable,
+            billed,
+            client_id,
+            project_id,
+            include_team,
+            include_deleted,
+            page,
+            per_page,
+        )
         url = self.client.timetracking_url("time_entries")
-        response = self.client.get(url, params=params)
+        return self._parse_page(self.client.get(url, params=params))
+
+    @staticmethod
+    def _list_params(
+        identity_id: Optional[int],
+        started_from: Optional[datetime],
+        started_to: Optional[datetime],
+        billable: Optional[bool],
+        billed: Optional[bool],
+        client_id: Optional[int],
+        project_id: Optional[int],
+        include_team: bool,
+        include_deleted: bool,
+        page: int,
+        per_page: int,
+    ) -> dict:
+        """Build query parameters for a time entries listing."""
+        filters = (
+            ("identity_id", identity_id),
+            ("started_from", started_from and started_from.isoformat(timespec="seconds")),
+            ("started_to", started_to and started_to.isoformat(timespec="seconds")),
+            ("billable", None if billable is None else str(billable).lower()),
+            ("billed", None if billed is None else str(billed).lower()),
+            ("client_id", client_id),
+            ("project_id", project_id),
+            ("team", "true" if include_team else None),
+            ("include_deleted", "true" if include_deleted else None),
+        )
+        params = {"page": page, "per_page": per_page}
+        params.update({key: value for key, value in filters if value is not None})
+
+        return params
 
+    def _parse_page(self, response: dict) -> tuple[list[TimeEntry], int]:
+        """Parse one time entries response into (entries, total count)."""
         entries_data = response.get("time_entries", [])
         total = response.get("meta", {}).get("total", len(entries_data))
 
@@ -145,32 +162,34 @@ class TimeEntriesAPI:
         """
         List all time entries (paginated automatically).
 
+        The first page reports the total count; the remaining pages are
+        then fetched concurrently and merged in page order.
+
         Returns all entries matching the filters.
         """
-        all_entries = []
-        page = 1
         per_page = 100
+        url = self.client.timetracking_url("time_entries")
+        params = self._list_params(
+            identity_id,
+            started_from,
+            started_to,
+            billable,
+            billed,
+            client_id,
+            project_id,
+            include_team,
+            False,
+            1,
+            per_page,
+        )
 
-        while True:
-            entries, total = self.list(
-                identity_id=identity_id,
-                started_from=started_from,
-                started_to=started_to,
-                billable=billable,
-                billed=billed,
-                client_id=client_id,
-                project_id=project_id,
-                include_team=include_team,
-                page=page,
-                per_page=per_page,
-            )
-
-            all_entries.extend(entries)
-
-            if len(all_entries) >= total or not entries:
-                break
+        all_entries, total = self._parse_page(self.client.get(url, params=params))
+        if not all_entries:
+            return all_entries
 
-            page += 1
+        last_page = math.ceil(total / per_page)
+        for response in self.client.get_pages(url, params, range(2, last_page + 1)):
+            all_entries.extend(self._parse_page(response)[0])
 
         return all_entries
 
@@ -228,8 +247,7 @@ class TimeEntriesAPI:
         if note is not None:
             payload["time_entry"]["note"] = note
 
-        response = self.client.client.put(url, headers=self.client.headers, json=payload)
-        response.raise_for_status()
+        self.client.put(url, data=payload)
         return True
 
     def create(
@@ -245,24 +263,22 @@ class TimeEntriesAPI:
         """Create a new time entry for the authenticated user."""
         url = self.client.timetracking_url("time_entries")
 
+        optional = (
+            ("project_id", project_id),
+            ("client_id", client_id),
+            ("service_id", service_id),
+            ("note", note),
+        )
         payload = {
             "time_entry": {
-                "started_at": started_at.strftime("%Y-%m-%dT%H:%M:%S"),
+                "started_at": started_at.isoformat(timespec="seconds"),
                 "duration": duration_seconds,
                 "is_logged": True,
                 "billable": billable,
+                **{key: value for key, value in optional if value},
             }
         }
 
-        if project_id:
-            payload["time_entry"]["project_id"] = project_id
-        if client_id:
-            payload["time_entry"]["client_id"] = client_id
-        if service_id:
-            payload["time_entry"]["service_id"] = service_id
-        if note:
-            payload["time_entry"]["note"] = note
-
         response = self.client.post(url, data=payload)
         entry_data = response.get("time_entry", {})
 
@@ -270,9 +286,7 @@ class TimeEntriesAPI:
             id=entry_data["id"],
             identity_id=entry_data["identity_id"],
             duration=entry_data.get("duration", 0),
-            started_at=datetime.fromisoformat(
-                entry_data["started_at"].replace("Z", "+00:00")
-            ),
+            started_at=datetime.fromisoformat(entry_data["started_at"]),
             is_logged=entry_data.get("is_logged", True),
             client_id=entry_data.get("client_id"),
             project_id=entry_data.get("project_id"),
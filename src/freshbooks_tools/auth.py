@@ -1,5 +1,6 @@
 """OAuth authentication for FreshBooks API."""
 
+import atexit
 import http.server
 import socketserver
 import threading
@@ -9,6 +10,7 @@ from typing import Optional
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import httpx
+import orjson
 from rich.console import Console
 
 from .config import Config, Tokens, save_tokens
@@ -32,12 +34,35 @@ SCOPES = [
     "user:expenses:read",
 ]
 
+# Explicit so a shared API client's JSON Content-Type default can't override it.
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+_token_client: Optional[httpx.Client] = None
+
+
+def _get_token_client() -> httpx.Client:
+    """Get the shared HTTP client for token requests, creating it on first use.
+
+    Reusing one pooled client lets a token refresh skip the DNS, TCP and TLS
+    setup of the previous exchange. It is closed at interpreter exit.
+    """
+    global _token_client
+    if _token_client is None:
+        _token_client = httpx.Client(
+            timeout=30.0,
+            transport=httpx.HTTPTransport(http2=True, retries=1),
+        )
+        atexit.register(_token_client.close)
+    return _token_client
+
 
 class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
     """HTTP handler for OAuth callback."""
 
     authorization_code: Optional[str] = None
     error: Optional[str] = None
+    # Set once a code or error arrives so the flow can stop waiting at once.
+    callback_received = threading.Event()
 
     def do_GET(self) -> None:
         """Handle the OAuth callback GET request."""
@@ -59,6 +84,7 @@ class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
             </html>
             """
             self.wfile.write(response)
+            OAuthCallbackHandler.callback_received.set()
         elif "error" in params:
             OAuthCallbackHandler.error = params.get("error_description", params["error"])[0]
             self.send_response(400)
@@ -74,6 +100,7 @@ class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
             </html>
             """.encode()
             self.wfile.write(response)
+            OAuthCallbackHandler.callback_received.set()
         else:
             self.send_response(404)
             self.end_headers()
@@ -94,8 +121,18 @@ def get_authorization_url(config: Config) -> str:
     return f"{AUTH_URL}?{urlencode(params)}"
 
 
-def exchange_code_for_tokens(config: Config, code: str) -> Tokens:
-    """Exchange authorization code for access and refresh tokens."""
+def exchange_code_for_tokens(
+    config: Config, code: str, http_client: Optional[httpx.Client] = None
+) -> Tokens:
+    """Exchange authorization code for access and refresh tokens.
+
+    Args:
+        config: Application configuration
+        code: Authorization code from the OAuth callback
+        http_client: Pooled client to send the request on, so its connection
+            to the API host can be reused afterwards. Defaults to the shared
+            token client.
+    """
     data = {
         "grant_type": "authorization_code",
         "client_id": config.client_id,
@@ -105,10 +142,11 @@ def exchange_code_for_tokens(config: Config, code: str) -> Tokens:
     }
 
     try:
-        with httpx.Client() as client:
-            response = client.post(TOKEN_URL, data=data, timeout=30.0)
-            response.raise_for_status()
-            token_data = response.json()
+        response = (http_client or _get_token_client()).post(
+            TOKEN_URL, data=data, headers=_FORM_HEADERS
+        )
+        response.raise_for_status()
+        token_data = orjson.loads(response.content)
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
             raise AuthenticationError("Authorization code invalid or expired") from e
@@ -143,10 +181,9 @@ def refresh_access_token(config: Config) -> Tokens:
     }
 
     try:
-        with httpx.Client() as client:
-            response = client.post(TOKEN_URL, data=data, timeout=30.0)
-            response.raise_for_status()
-            token_data = response.json()
+        response = _get_token_client().post(TOKEN_URL, data=data, headers=_FORM_HEADERS)
+        response.raise_for_status()
+        token_data = orjson.loads(response.content)
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
             raise AuthenticationError("Refresh token expired or invalid") from e
@@ -168,18 +205,23 @@ def refresh_access_token(config: Config) -> Tokens:
     )
 
 
-def start_oauth_flow(config: Config, local_port: int = 8374) -> Tokens:
+def start_oauth_flow(
+    config: Config, local_port: int = 8374, http_client: Optional[httpx.Client] = None
+) -> Tokens:
     """Start the OAuth flow with a local callback server.
 
     Args:
         config: Application configuration
         local_port: Local port to listen on (default 8374).
                    When using ngrok, this should match the port ngrok forwards to.
+        http_client: Pooled client to exchange the code on (see
+                   exchange_code_for_tokens).
     """
     import os
 
     OAuthCallbackHandler.authorization_code = None
     OAuthCallbackHandler.error = None
+    OAuthCallbackHandler.callback_received.clear()
 
     port = int(os.getenv("FRESHBOOKS_LOCAL_PORT", str(local_port)))
 
@@ -196,9 +238,10 @@ def start_oauth_flow(config: Config, local_port: int = 8374) -> Tokens:
 
     socketserver.TCPServer.allow_reuse_address = True
     server = socketserver.TCPServer(("127.0.0.1", port), OAuthCallbackHandler)
-    server.timeout = 120
 
-    server_thread = threading.Thread(target=server.handle_request)
+    # Serve until the callback arrives, so stray requests (e.g. favicon)
+    # don't end the flow and a successful callback doesn't wait out the timeout.
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
     server_thread.start()
 
     auth_url = get_authorization_url(config)
@@ -206,7 +249,8 @@ def start_oauth_flow(config: Config, local_port: int = 8374) -> Tokens:
     console.print(f"If the browser doesn't open, visit:\n[link={auth_url}]{auth_url}[/link]\n")
     webbrowser.open(auth_url)
 
-    server_thread.join(timeout=120)
+    OAuthCallbackHandler.callback_received.wait(timeout=120)
+    server.shutdown()
     server.server_close()
 
     if OAuthCallbackHandler.error:
@@ -218,7 +262,7 @@ def start_oauth_flow(config: Config, local_port: int = 8374) -> Tokens:
     console.print("[bold green]Authorization code received![/bold green]")
     console.print("Exchanging for tokens...")
 
-    tokens = exchange_code_for_tokens(config, OAuthCallbackHandler.authorization_code)
+    tokens = exchange_code_for_tokens(config, OAuthCallbackHandler.authorization_code, http_client)
     save_tokens(tokens)
 
     console.print("[bold green]Successfully authenticated![/bold green]")
@@ -1,15 +1,20 @@
 """CLI entry point for FreshBooks tools."""
 
 import csv
+import heapq
 import json
+import os
 import sys
+from collections import defaultdict
+from contextlib import nullcontext
 from datetime import datetime
 from decimal import Decimal
 from difflib import get_close_matches
-from io import StringIO
-from typing import Optional
+from functools import partial
+from typing import Any, Callable, Optional
 
 import click
+import orjson
 from rich.console import Console
 
 from .api.client import FreshBooksClient
@@ -17,17 +22,18 @@ from .api.expenses import ExpensesAPI
 from .api.invoices import InvoicesAPI
 from .api.projects import ProjectsAPI
 from .api.rates import RatesAPI
-from .api.reports import ReportsAPI
+from .api.reports import ReportsAPI, calculate_period_dso
 from .api.team import TeamAPI
 from .api.time_entries import TimeEntriesAPI
 from .auth import start_oauth_flow
 from .config import (
+    RATES_FILE,
     delete_tokens,
+    ensure_config_dir,
     load_account_info,
     load_config,
     load_tokens,
 )
-from .ui.invoice_browser import run_invoice_browser
 from .ui.tables import ARAgingTable, ClientARFormatter, ExpenseTable, ExpenseSummaryTable, InvoiceTable, RevenueSummaryTable, TimeEntryRow, TimeEntryTable
 
 console = Console()
@@ -39,6 +45,72 @@ RESOLUTION_MAP = {
 }
 
 
+def _run_concurrently(client: FreshBooksClient, *tasks: Callable[[], Any]) -> list[Any]:
+    """Run independent lookup tasks on the client's thread pool.
+
+    Used to overlap the roster, client, service and rate fetches a command
+    needs before it walks its time entries. Results are in task order.
+    """
+    # Validate the token once up front so an expired one is refreshed here,
+    # before the workers start, rather than by whichever worker gets there.
+    client.headers
+    return client.map_concurrent(lambda task: task(), tasks)
+
+
+def _group_entry_totals(
+    entries: list,
+    amounts: list[tuple[Decimal, Decimal, Decimal]],
+    key_of: Callable[[Any], str],
+) -> dict[str, list[Decimal]]:
+    """Sum [hours, billable, cost] per group key in a single pass over entries."""
+    totals: dict[str, list[Decimal]] = {}
+    for entry, (hours, billable, cost) in zip(entries, amounts):
+        key = key_of(entry)
+        acc = totals.get(key)
+        if acc is None:
+            acc = totals[key] = [Decimal("0"), Decimal("0"), Decimal("0")]
+        acc[0] += hours
+        acc[1] += billable
+        acc[2] += cost
+    return totals
+
+
+def _print_json(data: Any, default: Optional[Callable[[Any], Any]] = None) -> None:
+    """Print data as indented JSON, encoded with orjson.
+
+    default converts values orjson can't serialize natively, e.g. str for
+    the Decimals in a model_dump().
+    """
+    click.echo(orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2))
+
+
+def _float_or_none(value: Optional[Decimal]) -> Optional[float]:
+    """Convert an optional Decimal for JSON output, keeping zero as 0.0."""
+    return None if value is None else float(value)
+
+
+def _compute_entry_amounts(
+    entries: list, billable_rates: dict, cost_rates: dict
+) -> list[tuple[Decimal, Decimal, Decimal]]:
+    """Compute (hours, billable amount, cost amount) for each entry, aligned with entries.
+
+    Hours are derived once per entry here so the reductions downstream only
+    add. Non-billable entries and entries without a rate contribute zero.
+    """
+    zero = Decimal("0")
+    amounts = []
+    for entry in entries:
+        hours = entry.hours
+        billable = zero
+        if entry.billable:
+            rate = billable_rates[entry.identity_id, entry.service_id]
+            if rate:
+                billable = hours * rate
+        cost_rate = cost_rates[entry.identity_id]
+        amounts.append((hours, billable, hours * cost_rate if cost_rate else zero))
+    return amounts
+
+
 def parse_month(month_str: str) -> tuple[int, int]:
     """Parse month string in YYYY-MM format."""
     try:
@@ -54,9 +126,12 @@ def parse_month(month_str: str) -> tuple[int, int]:
 
 @click.group()
 @click.version_option()
-def cli():
+@click.option("--no-cache", is_flag=True, help="Bypass cached API responses and fetch fresh data")
+def cli(no_cache: bool):
     """FreshBooks CLI tools for time entries and invoices."""
-    pass
+    if no_cache:
+        os.environ["FRESHBOOKS_NO_CACHE"] = "1"
+        load_config.cache_clear()
 
 
 @cli.group()
@@ -95,9 +170,10 @@ def auth_login():
         console.print("[dim]Make sure this URI is added to your FreshBooks app in the Developer Portal.[/dim]")
         console.print()
 
-        start_oauth_flow(config)
-
+        # Exchange the code on the API client's pool so the account lookup
+        # that follows reuses the same connection.
         with FreshBooksClient(config) as client:
+            config.tokens = start_oauth_flow(config, http_client=client.client)
             client.ensure_account_info()
             console.print("[green]Account info cached successfully![/green]")
 
@@ -195,18 +271,30 @@ def time_list(teammate: Optional[str], month: Optional[str], billable: bool, sho
             if teammate:
                 title += f" - {teammate}"
 
+            teammate_names, client_names, service_names, _ = _run_concurrently(
+                client,
+                partial(team_api.get_team_member_names, [e.identity_id for e in entries]),
+                partial(invoices_api.get_client_names, [e.client_id for e in entries if e.client_id]),
+                partial(rates_api.get_service_names, [e.service_id for e in entries if e.service_id]),
+                partial(rates_api.warm_service_rates, [e.service_id for e in entries if e.billable]),
+            )
+            billable_rates = rates_api.get_billable_rates(
+                (e.identity_id, e.service_id) for e in entries if e.billable
+            )
+            cost_rates = rates_api.get_cost_rates(e.identity_id for e in entries)
+
             rows = []
             for entry in entries:
-                teammate_name = team_api.get_team_member_name(entry.identity_id)
-                client_name = invoices_api.get_client_name(entry.client_id) if entry.client_id else "-"
+                teammate_name = teammate_names[entry.identity_id]
+                client_name = client_names[entry.client_id] if entry.client_id else "-"
                 project_name = f"Project {entry.project_id}" if entry.project_id else "-"
-                service_name = rates_api.get_service_name(entry.service_id) if entry.service_id else "-"
+                service_name = service_names[entry.service_id] if entry.service_id else "-"
 
-                billable_rate = rates_api.get_billable_rate(entry.identity_id, entry.service_id) if entry.billable else None
-                cost_rate = rates_api.get_cost_rate(entry.identity_id)
+                billable_rate = billable_rates[entry.identity_id, entry.service_id] if entry.billable else None
+                cost_rate = cost_rates[entry.identity_id]
 
                 rows.append(TimeEntryRow(
-                    date=entry.started_at.strftime("%Y-%m-%d"),
+                    date=entry.started_at.date().isoformat(),
                     teammate=teammate_name,
                     client=client_name,
                     project=project_name,
@@ -218,11 +306,12 @@ def time_list(teammate: Optional[str], month: Optional[str], billable: bool, sho
                 ))
 
             if as_json:
-                total_hours = sum(r.hours for r in rows)
-                total_billable = sum(r.billable_amount or Decimal("0") for r in rows)
-                total_cost = sum(r.cost_amount or Decimal("0") for r in rows)
+                # JSON emits floats anyway, so accumulate floats rather than Decimals.
+                total_hours = sum((float(r.hours) for r in rows), 0.0)
+                total_billable = sum((float(r.billable_amount) for r in rows if r.billable_amount), 0.0)
+                total_cost = sum((float(r.cost_amount) for r in rows if r.cost_amount), 0.0)
                 profit = total_billable - total_cost
-                margin = float(profit / total_billable * 100) if total_billable else 0.0
+                margin = profit / total_billable * 100 if total_billable else 0.0
                 output = {
                     "entries": [
                         {
@@ -241,14 +330,14 @@ def time_list(teammate: Optional[str], month: Optional[str], billable: bool, sho
                         for r in rows
                     ],
                     "totals": {
-                        "hours": float(total_hours),
-                        "billable": float(total_billable),
-                        "cost": float(total_cost),
-                        "profit": float(profit),
+                        "hours": total_hours,
+                        "billable": total_billable,
+                        "cost": total_cost,
+                        "profit": profit,
                         "margin": margin,
                     },
                 }
-                print(json.dumps(output, indent=2))
+                _print_json(output)
                 return
 
             if not rows:
@@ -292,85 +381,60 @@ def time_summary(month: str, by_teammate: bool, by_client: bool, as_json: bool):
 
             if not entries:
                 if as_json:
-                    print(json.dumps({"month": month, "total_hours": 0, "total_billable": 0, "total_cost": 0, "profit": 0, "margin": 0, "groups": {}}))
+                    _print_json({"month": month, "total_hours": 0, "total_billable": 0, "total_cost": 0, "profit": 0, "margin": 0, "groups": {}})
                 else:
                     console.print(f"[yellow]No time entries found for {year}-{mon:02d}.[/yellow]")
                 return
 
+            teammate_names, _ = _run_concurrently(
+                client,
+                partial(team_api.get_team_member_names, [e.identity_id for e in entries]),
+                partial(rates_api.warm_service_rates, [e.service_id for e in entries if e.billable]),
+            )
+
+            billable_rates = rates_api.get_billable_rates(
+                (e.identity_id, e.service_id) for e in entries if e.billable
+            )
+            cost_rates = rates_api.get_cost_rates(e.identity_id for e in entries)
+            amounts = _compute_entry_amounts(entries, billable_rates, cost_rates)
+
             if as_json:
-                _print_time_summary_json(entries, month, by_teammate, by_client, team_api, rates_api, invoices_api)
+                _print_time_summary_json(entries, amounts, month, by_teammate, by_client, team_api, invoices_api)
                 return
 
             if by_teammate:
-                groups: dict[str, list] = {}
-                for entry in entries:
-                    name = team_api.get_team_member_name(entry.identity_id)
-                    if name not in groups:
-                        groups[name] = []
-                    groups[name].append(entry)
+                key_of = lambda e: teammate_names[e.identity_id]
+            elif by_client:
+                client_names = invoices_api.get_client_names(e.client_id for e in entries if e.client_id)
+                key_of = lambda e: client_names[e.client_id] if e.client_id else "No Client"
+            else:
+                key_of = lambda e: ""
+            groups = _group_entry_totals(entries, amounts, key_of)
 
+            if by_teammate:
                 console.print(f"\n[bold]Time Summary by Teammate - {year}-{mon:02d}[/bold]\n")
 
-                for name, group_entries in sorted(groups.items()):
-                    total_hours = sum(e.hours for e in group_entries)
-                    total_billable = Decimal("0")
-                    total_cost = Decimal("0")
-
-                    for entry in group_entries:
-                        if entry.billable:
-                            rate = rates_api.get_billable_rate(entry.identity_id, entry.service_id)
-                            if rate:
-                                total_billable += entry.hours * rate
-                        cost_rate = rates_api.get_cost_rate(entry.identity_id)
-                        if cost_rate:
-                            total_cost += entry.hours * cost_rate
-
+                for name, (total_hours, total_billable, total_cost) in sorted(groups.items()):
                     console.print(f"[green]{name}[/green]")
                     console.print(f"  Hours: [magenta]{total_hours:.2f}[/magenta]")
                     console.print(f"  Billable: [green]${total_billable:.2f}[/green]")
                     console.print(f"  Cost: [red]${total_cost:.2f}[/red]")
                     profit = total_billable - total_cost
-                    console.print(f"  Profit: [{'green' if profit >= 0 else 'red'}]${profit:.2f}[/{'green' if profit >= 0 else 'red'}]")
+                    color = "green" if profit >= 0 else "red"
+                    console.print(f"  Profit: [{color}]${profit:.2f}[/{color}]")
                     console.print()
 
             elif by_client:
-                groups: dict[str, list] = {}
-                for entry in entries:
-                    name = invoices_api.get_client_name(entry.client_id) if entry.client_id else "No Client"
-                    if name not in groups:
-                        groups[name] = []
-                    groups[name].append(entry)
-
                 console.print(f"\n[bold]Time Summary by Client - {year}-{mon:02d}[/bold]\n")
 
-                for name, group_entries in sorted(groups.items()):
-                    total_hours = sum(e.hours for e in group_entries)
-                    total_billable = Decimal("0")
-
-                    for entry in group_entries:
-                        if entry.billable:
-                            rate = rates_api.get_billable_rate(entry.identity_id, entry.service_id)
-                            if rate:
-                                total_billable += entry.hours * rate
-
+                for name, (total_hours, total_billable, _) in sorted(groups.items()):
                     console.print(f"[yellow]{name}[/yellow]")
                     console.print(f"  Hours: [magenta]{total_hours:.2f}[/magenta]")
                     console.print(f"  Billable: [green]${total_billable:.2f}[/green]")
                     console.print()
 
             else:
-                total_hours = sum(e.hours for e in entries)
-                total_billable = Decimal("0")
-                total_cost = Decimal("0")
-
-                for entry in entries:
-                    if entry.billable:
-                        rate = rates_api.get_billable_rate(entry.identity_id, entry.service_id)
-                        if rate:
-                            total_billable += entry.hours * rate
-                    cost_rate = rates_api.get_cost_rate(entry.identity_id)
-                    if cost_rate:
-                        total_cost += entry.hours * cost_rate
+                total_hours, total_billable, total_cost = groups[""]
 
                 console.print(f"\n[bold]Time Summary - {year}-{mon:02d}[/bold]\n")
                 console.print(f"Total Entries: {len(entries)}")
@@ -379,72 +443,54 @@ def time_summary(month: str, by_teammate: bool, by_client: bool, as_json: bool):
                 console.print(f"Total Cost: [red]${total_cost:.2f}[/red]")
                 profit = total_billable - total_cost
                 margin = (profit / total_billable * 100) if total_billable else Decimal("0")
-                console.print(f"Profit: [{'green' if profit >= 0 else 'red'}]${profit:.2f}[/{'green' if profit >= 0 else 'red'}]")
-                console.print(f"Margin: [{'green' if margin >= 0 else 'red'}]{margin:.1f}%[/{'green' if margin >= 0 else 'red'}]")
+                color = "green" if profit >= 0 else "red"
+                console.print(f"Profit: [{color}]${profit:.2f}[/{color}]")
+                margin_color = "green" if margin >= 0 else "red"
+                console.print(f"Margin: [{margin_color}]{margin:.1f}%[/{margin_color}]")
 
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
-def _print_time_summary_json(entries, month, by_teammate, by_client, team_api, rates_api, invoices_api):
+def _print_time_summary_json(entries, amounts, month, by_teammate, by_client, team_api, invoices_api):
     """Build and print JSON output for time summary."""
-    total_hours = float(sum(e.hours for e in entries))
-    total_billable = Decimal("0")
-    total_cost = Decimal("0")
-
-    for entry in entries:
-        if entry.billable:
-            rate = rates_api.get_billable_rate(entry.identity_id, entry.service_id)
-            if rate:
-                total_billable += entry.hours * rate
-        cost_rate = rates_api.get_cost_rate(entry.identity_id)
-        if cost_rate:
-            total_cost += entry.hours * cost_rate
-
-    profit = total_billable - total_cost
-    margin = float(profit / total_billable * 100) if total_billable else 0.0
+    if by_teammate:
+        names = team_api.get_team_member_names(e.identity_id for e in entries)
+        key_of = lambda e: names[e.identity_id]
+    elif by_client:
+        names = invoices_api.get_client_names(e.client_id for e in entries if e.client_id)
+        key_of = lambda e: names[e.client_id] if e.client_id else "No Client"
+    else:
+        key_of = lambda e: ""
+    grouped = by_teammate or by_client
 
+    total_hours = total_billable = total_cost = Decimal("0")
     groups = {}
-    if by_teammate or by_client:
-        group_map: dict[str, list] = {}
-        for entry in entries:
-            if by_teammate:
-                key = team_api.get_team_member_name(entry.identity_id)
-            else:
-                key = invoices_api.get_client_name(entry.client_id) if entry.client_id else "No Client"
-            group_map.setdefault(key, []).append(entry)
-
-        for name, group_entries in sorted(group_map.items()):
-            g_hours = float(sum(e.hours for e in group_entries))
-            g_billable = Decimal("0")
-            g_cost = Decimal("0")
-            for entry in group_entries:
-                if entry.billable:
-                    rate = rates_api.get_billable_rate(entry.identity_id, entry.service_id)
-                    if rate:
-                        g_billable += entry.hours * rate
-                cr = rates_api.get_cost_rate(entry.identity_id)
-                if cr:
-                    g_cost += entry.hours * cr
-            g_profit = g_billable - g_cost
+    for name, (g_hours, g_billable, g_cost) in sorted(_group_entry_totals(entries, amounts, key_of).items()):
+        total_hours += g_hours
+        total_billable += g_billable
+        total_cost += g_cost
+        if grouped:
             groups[name] = {
-                "hours": g_hours,
+                "hours": float(g_hours),
                 "billable": float(g_billable),
                 "cost": float(g_cost),
-                "profit": float(g_profit),
+                "profit": float(g_billable - g_cost),
             }
+    profit = total_billable - total_cost
+    margin = float(profit / total_billable * 100) if total_billable else 0.0
 
     output = {
         "month": month,
-        "total_hours": total_hours,
+        "total_hours": float(total_hours),
         "total_billable": float(total_billable),
         "total_cost": float(total_cost),
         "profit": float(profit),
         "margin": margin,
         "groups": groups,
     }
-    print(json.dumps(output, indent=2))
+    _print_json(output)
 
 
 @time.command("export")
@@ -474,45 +520,54 @@ def time_export(month: str, fmt: str, output: Optional[str]):
                 console.print(f"[yellow]No time entries found for {year}-{mon:02d}.[/yellow]", err=True)
                 return
 
-            buffer = StringIO()
-            writer = csv.writer(buffer)
-            writer.writerow([
-                "Date", "Teammate", "Client", "Project", "Service",
-                "Hours", "Billable Rate", "Cost Rate", "Billable Amount", "Cost Amount", "Note"
-            ])
-
-            for entry in entries:
-                teammate_name = team_api.get_team_member_name(entry.identity_id)
-                client_name = invoices_api.get_client_name(entry.client_id) if entry.client_id else ""
-                project_name = f"Project {entry.project_id}" if entry.project_id else ""
-                service_name = rates_api.get_service_name(entry.service_id) if entry.service_id else ""
-
-                billable_rate = rates_api.get_billable_rate(entry.identity_id, entry.service_id) if entry.billable else None
-                cost_rate = rates_api.get_cost_rate(entry.identity_id)
-
-                billable_amount = entry.hours * billable_rate if billable_rate else None
-                cost_amount = entry.hours * cost_rate if cost_rate else None
+            teammate_names, client_names, service_names, _ = _run_concurrently(
+                client,
+                partial(team_api.get_team_member_names, [e.identity_id for e in entries]),
+                partial(invoices_api.get_client_names, [e.client_id for e in entries if e.client_id]),
+                partial(rates_api.get_service_names, [e.service_id for e in entries if e.service_id]),
+                partial(rates_api.warm_service_rates, [e.service_id for e in entries if e.billable]),
+            )
+            billable_rates = rates_api.get_billable_rates(
+                (e.identity_id, e.service_id) for e in entries if e.billable
+            )
+            cost_rates = rates_api.get_cost_rates(e.identity_id for e in entries)
 
+            # Rows go straight to the destination rather than a StringIO copy.
+            with open(output, "w", newline="") if output else nullcontext(sys.stdout) as out:
+                writer = csv.writer(out)
                 writer.writerow([
-                    entry.started_at.strftime("%Y-%m-%d"),
-                    teammate_name,
-                    client_name,
-                    project_name,
-                    service_name,
-                    f"{entry.hours:.2f}",
-                    f"{billable_rate:.2f}" if billable_rate else "",
-                    f"{cost_rate:.2f}" if cost_rate else "",
-                    f"{billable_amount:.2f}" if billable_amount else "",
-                    f"{cost_amount:.2f}" if cost_amount else "",
-                    entry.note or "",
+                    "Date", "Teammate", "Client", "Project", "Service",
+                    "Hours", "Billable Rate", "Cost Rate", "Billable Amount", "Cost Amount", "Note"
                 ])
 
+                for entry in entries:
+                    teammate_name = teammate_names[entry.identity_id]
+                    client_name = client_names[entry.client_id] if entry.client_id else ""
+                    project_name = f"Project {entry.project_id}" if entry.project_id else ""
+                    service_name = service_names[entry.service_id] if entry.service_id else ""
+
+                    billable_rate = billable_rates[entry.identity_id, entry.service_id] if entry.billable else None
+                    cost_rate = cost_rates[entry.identity_id]
+
+                    billable_amount = entry.hours * billable_rate if billable_rate else None
+                    cost_amount = entry.hours * cost_rate if cost_rate else None
+
+                    writer.writerow([
+                        entry.started_at.date().isoformat(),
+                        teammate_name,
+                        client_name,
+                        project_name,
+                        service_name,
+                        f"{entry.hours:.2f}",
+                        f"{billable_rate:.2f}" if billable_rate else "",
+                        f"{cost_rate:.2f}" if cost_rate else "",
+                        f"{billable_amount:.2f}" if billable_amount else "",
+                        f"{cost_amount:.2f}" if cost_amount else "",
+                        entry.note or "",
+                    ])
+
             if output:
-                with open(output, "w") as f:
-                    f.write(buffer.getvalue())
                 console.print(f"[green]Exported to {output}[/green]", err=True)
-            else:
-                print(buffer.getvalue())
 
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}", err=True)
@@ -560,7 +615,13 @@ def time_add(hours: float, date: Optional[str], project: str,
             if not matching_projects:
                 all_projects = projects_api.list()
                 console.print(f"[red]No projects found matching '{project}'[/red]")
-                if all_projects:
+                titles_by_lower = {p.title.lower(): p.title for p in all_projects}
+                suggestions = get_close_matches(project.lower(), titles_by_lower, n=3, cutoff=0.6)
+                if suggestions:
+                    console.print("\n[yellow]Did you mean:[/yellow]")
+                    for title_lower in suggestions:
+                        console.print(f"  - {titles_by_lower[title_lower]}")
+                elif all_projects:
                     console.print("\n[yellow]Available projects:[/yellow]")
                     for p in all_projects[:10]:
                         console.print(f"  - {p.title}")
@@ -586,11 +647,20 @@ def time_add(hours: float, date: Optional[str], project: str,
                 project_with_services = projects_api.get_with_services(selected_project.id)
                 services = project_with_services.services if project_with_services else []
                 service_lower = service.lower()
-                matching_services = [s for s in services if service_lower in s.name.lower()]
+                services_by_lower = [(s.name.lower(), s) for s in services]
+                matching_services = [s for name_lower, s in services_by_lower if service_lower in name_lower]
 
                 if not matching_services:
                     console.print(f"[red]No services found matching '{service}' for project '{selected_project.title}'[/red]")
-                    if services:
+                    suggestions = get_close_matches(
+                        service_lower, [name_lower for name_lower, _ in services_by_lower], n=3, cutoff=0.6
+                    )
+                    if suggestions:
+                        console.print("\n[yellow]Did you mean:[/yellow]")
+                        names_by_lower = dict(services_by_lower)
+                        for name_lower in suggestions:
+                            console.print(f"  - {names_by_lower[name_lower].name}")
+                    elif services:
                         console.print("\n[yellow]Available services for this project:[/yellow]")
                         for s in services:
                             console.print(f"  - {s.name}")
@@ -690,74 +760,77 @@ def time_unbilled(by_client: bool, by_project: bool, by_teammate: bool,
 
             if not entries:
                 if as_json:
-                    print(json.dumps({"entries": [], "total_hours": 0, "total_amount": 0}))
+                    _print_json({"entries": [], "total_hours": 0, "total_amount": 0})
                 else:
                     console.print("[yellow]No unbilled time entries found.[/yellow]")
                 return
 
-            total_hours = sum(float(e.hours) for e in entries)
-            total_amount = Decimal("0")
+            # With both --by-teammate and --by-project, JSON output groups by
+            # teammate and the table by project, as they always have.
+            if as_json and by_teammate:
+                by_project = False
+
+            # Resolve only the names the selected grouping prints, alongside the rate warmup.
+            if by_project:
+                fetch_names = partial(projects_api.get_by_ids, (e.project_id for e in entries if e.project_id))
+                group_label = "Project"
+            elif by_teammate:
+                fetch_names = partial(team_api.get_team_member_names, [e.identity_id for e in entries])
+                group_label = "Teammate"
+            else:
+                fetch_names = partial(invoices_api.get_client_names, [e.client_id for e in entries if e.client_id])
+                group_label = "Client"
+            names, _ = _run_concurrently(
+                client,
+                fetch_names,
+                partial(rates_api.warm_service_rates, [e.service_id for e in entries]),
+            )
+            if by_project:
+                project_titles = {pid: p.title for pid, p in names.items()}
+                key_of = lambda e: project_titles.get(e.project_id, "No Project")
+            elif by_teammate:
+                key_of = lambda e: names[e.identity_id]
+            else:
+                key_of = lambda e: names[e.client_id] if e.client_id else "No Client"
+
+            billable_rates = rates_api.get_billable_rates((e.identity_id, e.service_id) for e in entries)
+            # Hours and amounts are derived once per entry; grouping below only sums them.
+            hours = [e.hours for e in entries]
+            amounts = [
+                entry_hours * rate if (rate := billable_rates[e.identity_id, e.service_id]) else Decimal("0")
+                for e, entry_hours in zip(entries, hours)
+            ]
+            float_hours = [float(h) for h in hours]
 
-            for e in entries:
-                rate = rates_api.get_billable_rate(e.identity_id, e.service_id)
-                if rate:
-                    total_amount += e.hours * rate
+            total_hours = sum(float_hours)
+            total_amount = sum(amounts, Decimal("0"))
 
             if as_json:
-                groups = {}
-                for e in entries:
-                    if by_teammate:
-                        key = team_api.get_team_member_name(e.identity_id)
-                    elif by_project:
-                        proj = projects_api.get_by_id(e.project_id) if e.project_id else None
-                        key = proj.title if proj else "No Project"
-                    else:
-                        key = invoices_api.get_client_name(e.client_id) if e.client_id else "No Client"
-
-                    if key not in groups:
-                        groups[key] = {"hours": 0, "amount": 0}
-                    groups[key]["hours"] += float(e.hours)
-                    rate = rates_api.get_billable_rate(e.identity_id, e.service_id)
-                    if rate:
-                        groups[key]["amount"] += float(e.hours * rate)
+                groups = defaultdict(lambda: {"hours": 0, "amount": 0})
+                for e, entry_hours, amount in zip(entries, float_hours, amounts):
+                    group = groups[key_of(e)]
+                    group["hours"] += entry_hours
+                    if amount:
+                        group["amount"] += float(amount)
 
                 output = {
                     "total_hours": total_hours,
                     "total_amount": float(total_amount),
                     "groups": groups,
                 }
-                print(json.dumps(output, indent=2))
+                _print_json(output)
                 return
 
-            if by_project:
-                groups: dict[str, list] = {}
-                for e in entries:
-                    proj = projects_api.get_by_id(e.project_id) if e.project_id else None
-                    key = proj.title if proj else "No Project"
-                    groups.setdefault(key, []).append(e)
-                group_label = "Project"
-            elif by_teammate:
-                groups: dict[str, list] = {}
-                for e in entries:
-                    key = team_api.get_team_member_name(e.identity_id)
-                    groups.setdefault(key, []).append(e)
-                group_label = "Teammate"
-            else:
-                groups: dict[str, list] = {}
-                for e in entries:
-                    key = invoices_api.get_client_name(e.client_id) if e.client_id else "No Client"
-                    groups.setdefault(key, []).append(e)
-                group_label = "Client"
+            groups: defaultdict[str, list] = defaultdict(list)
+            for e, entry_hours, amount in zip(entries, float_hours, amounts):
+                groups[key_of(e)].append((entry_hours, amount))
 
             console.print(f"\n[bold]Unbilled Time by {group_label}[/bold]\n")
 
-            for name, group_entries in sorted(groups.items()):
-                group_hours = sum(float(e.hours) for e in group_entries)
-                group_amount = Decimal("0")
-                for e in group_entries:
-                    rate = rates_api.get_billable_rate(e.identity_id, e.service_id)
-                    if rate:
-                        group_amount += e.hours * rate
+            for name in sorted(groups):
+                group_entries = groups[name]
+                group_hours = sum(entry_hours for entry_hours, _ in group_entries)
+                group_amount = sum((amount for _, amount in group_entries), Decimal("0"))
 
                 console.print(f"[cyan]{name}[/cyan]")
                 console.print(f"  Hours: [magenta]{group_hours:.2f}[/magenta]")
@@ -789,6 +862,9 @@ def invoices_browse():
             console.print("[red]Not authenticated. Run 'fb auth login' first.[/red]")
             sys.exit(1)
 
+        # Textual is only needed here, so keep it out of every other command's startup.
+        from .ui.invoice_browser import run_invoice_browser
+
         run_invoice_browser(config)
 
     except Exception as e:
@@ -815,8 +891,8 @@ def invoices_list(client: Optional[str], status: Optional[str], limit: int, as_j
 
             customer_id = None
             if client:
-                clients = invoices_api.list_clients()
-                matching = [c for c in clients if client.lower() in c.display_name.lower()]
+                needle = client.lower()
+                matching = [c for c in invoices_api.list_clients() if needle in c.display_name.lower()]
                 if not matching:
                     console.print(f"[red]No client found matching '{client}'[/red]")
                     sys.exit(1)
@@ -832,35 +908,39 @@ def invoices_list(client: Optional[str], status: Optional[str], limit: int, as_j
                 status=status,
             )
 
-            all_invoices = sorted(all_invoices, key=lambda i: i.create_date, reverse=True)[:limit]
+            all_invoices = heapq.nlargest(limit, all_invoices, key=lambda i: i.create_date)
 
             if as_json:
-                total_amount = sum(i.amount or Decimal("0") for i in all_invoices)
-                total_paid = sum(i.paid or Decimal("0") for i in all_invoices)
-                total_outstanding = sum(i.outstanding or Decimal("0") for i in all_invoices)
+                total_amount = total_paid = total_outstanding = Decimal("0")
+                invoices_out = []
+                for inv in all_invoices:
+                    if inv.amount:
+                        total_amount += inv.amount
+                    if inv.paid:
+                        total_paid += inv.paid
+                    if inv.outstanding:
+                        total_outstanding += inv.outstanding
+                    invoices_out.append({
+                        "id": inv.id,
+                        "invoice_number": inv.invoice_number,
+                        "client": inv.client_name,
+                        "create_date": inv.create_date,
+                        "due_date": inv.due_date,
+                        "status": inv.display_status,
+                        "currency": inv.currency_code,
+                        "amount": _float_or_none(inv.amount),
+                        "paid": _float_or_none(inv.paid),
+                        "outstanding": _float_or_none(inv.outstanding),
+                    })
                 output = {
-                    "invoices": [
-                        {
-                            "id": inv.id,
-                            "invoice_number": inv.invoice_number,
-                            "client": inv.client_name,
-                            "create_date": inv.create_date,
-                            "due_date": inv.due_date,
-                            "status": inv.display_status,
-                            "currency": inv.currency_code,
-                            "amount": float(inv.amount) if inv.amount else None,
-                            "paid": float(inv.paid) if inv.paid else None,
-                            "outstanding": float(inv.outstanding) if inv.outstanding else None,
-                        }
-                        for inv in all_invoices
-                    ],
+                    "invoices": invoices_out,
                     "totals": {
                         "amount": float(total_amount),
                         "paid": float(total_paid),
                         "outstanding": float(total_outstanding),
                     },
                 }
-                print(json.dumps(output, indent=2))
+                _print_json(output)
                 return
 
             if not all_invoices:
@@ -896,13 +976,20 @@ def invoices_show(invoice_number: str, as_json: bool):
         with FreshBooksClient(config) as fb_client:
             invoices_api = InvoicesAPI(fb_client)
 
-            all_invoices = invoices_api.list_all_invoices(include_lines=True, include_payments=True)
-
-            invoice = None
-            for inv in all_invoices:
-                if inv.invoice_number == invoice_number or str(inv.id) == invoice_number:
-                    invoice = inv
-                    break
+            # Let the API filter by number; the exact comparison guards against
+            # partial matches from the search.
+            invoice = next(
+                (
+                    inv
+                    for inv in invoices_api.iter_all_invoices(
+                        invoice_number=invoice_number, include_lines=True, include_payments=True
+                    )
+                    if inv.invoice_number == invoice_number
+                ),
+                None,
+            )
+            if not invoice and invoice_number.isdigit():
+                invoice = invoices_api.get_invoice(int(invoice_number))
 
             if not invoice:
                 if as_json:
@@ -921,17 +1008,17 @@ def invoices_show(invoice_number: str, as_json: bool):
                         "due_date": invoice.due_date,
                         "status": invoice.display_status,
                         "currency": invoice.currency_code,
-                        "amount": float(invoice.amount) if invoice.amount else None,
-                        "paid": float(invoice.paid) if invoice.paid else None,
-                        "outstanding": float(invoice.outstanding) if invoice.outstanding else None,
-                        "discount": float(invoice.discount_value) if invoice.discount_value else None,
+                        "amount": _float_or_none(invoice.amount),
+                        "paid": _float_or_none(invoice.paid),
+                        "outstanding": _float_or_none(invoice.outstanding),
+                        "discount": _float_or_none(invoice.discount_value),
                         "lines": [
                             {
                                 "name": line.name,
                                 "description": line.description,
-                                "qty": float(line.qty) if line.qty else None,
-                                "unit_cost": float(line.unit_cost) if line.unit_cost else None,
-                                "amount": float(line.amount) if line.amount else None,
+                                "qty": _float_or_none(line.qty),
+                                "unit_cost": _float_or_none(line.unit_cost),
+                                "amount": _float_or_none(line.amount),
                                 "type": line.type,
                             }
                             for line in (invoice.lines or [])
@@ -939,7 +1026,7 @@ def invoices_show(invoice_number: str, as_json: bool):
                         "payments": [
                             {
                                 "id": p.id,
-                                "amount": float(p.amount) if p.amount else None,
+                                "amount": _float_or_none(p.amount),
                                 "date": p.date,
                                 "type": p.type,
                                 "note": p.note,
@@ -949,7 +1036,7 @@ def invoices_show(invoice_number: str, as_json: bool):
                         ],
                     }
                 }
-                print(json.dumps(output, indent=2))
+                _print_json(output)
                 return
 
             table = InvoiceTable(console)
@@ -996,13 +1083,7 @@ def reports_ar_aging(start_date: Optional[str], end_date: Optional[str], currenc
                 return
 
             if as_json:
-                import json
-                output = json.dumps(
-                    report.model_dump(),
-                    default=str,
-                    indent=2
-                )
-                click.echo(output)
+                _print_json(report.model_dump(), default=str)
             else:
                 table = ARAgingTable(console)
                 table.print_report(report)
@@ -1059,25 +1140,24 @@ def reports_client_ar(client_id: Optional[int], client_name: Optional[str], deta
                     matched_id = account.get("userid")
 
             if not account:
-                all_clients = invoices_api.list_clients()
+                clients_by_id = invoices_api.get_clients_by_id()
 
                 if client_id:
-                    for c in all_clients:
-                        if c.id == client_id:
-                            matched_name = c.display_name
-                            matched_id = c.id
-                            break
+                    c = clients_by_id.get(client_id)
+                    if c:
+                        matched_name = c.display_name
+                        matched_id = c.id
                 else:
-                    client_names = [c.display_name for c in all_clients]
-                    matches = get_close_matches(client_name, client_names, n=1, cutoff=0.6)
+                    # Reversed so the first client with a duplicate name wins.
+                    name_to_client = {c.display_name: c for c in reversed(clients_by_id.values())}
+                    matches = get_close_matches(client_name, name_to_client.keys(), n=1, cutoff=0.6)
                     if matches:
-                        matched = next(c for c in all_clients if c.display_name == matches[0])
+                        matched = name_to_client[matches[0]]
                         matched_name = matched.display_name
                         matched_id = matched.id
 
             if not matched_name:
                 if as_json:
-                    import json
                     print(json.dumps({"error": "Client not found"}))
                 else:
                     console.print("[red]Error: Client not found[/red]")
@@ -1100,15 +1180,14 @@ def reports_client_ar(client_id: Optional[int], client_name: Optional[str], deta
 
             if not account:
                 if as_json:
-                    import json
-                    output = {
+                    json_output = {
                         "client_name": matched_name,
                         "client_id": matched_id,
                         "total": 0.0,
                         "currency": report.currency_code,
                         "has_outstanding": False,
                     }
-                    print(json.dumps(output, indent=2))
+                    _print_json(json_output)
                 else:
                     console.print(f"Matched: {matched_name} (ID: {matched_id})")
                     console.print(f"$0.00 outstanding ({report.currency_code})")
@@ -1118,8 +1197,7 @@ def reports_client_ar(client_id: Optional[int], client_name: Optional[str], deta
                 worst_bucket = formatter.get_worst_bucket(account)
 
                 if as_json:
-                    import json
-                    output = {
+                    json_output = {
                         "client_name": matched_name,
                         "client_id": matched_id,
                         "total": float(total_decimal),
@@ -1132,9 +1210,9 @@ def reports_client_ar(client_id: Optional[int], client_name: Optional[str], deta
                         for bucket_key in ["0-30", "31-60", "61-90", "91+"]:
                             amount = formatter._get_bucket_amount(account, bucket_key)
                             buckets[bucket_key] = float(amount)
-                        output["buckets"] = buckets
+                        json_output["buckets"] = buckets
 
-                    print(json.dumps(output, indent=2))
+                    _print_json(json_output)
                 else:
                     console.print(f"Matched: {matched_name} (ID: {matched_id})")
                     if detail:
@@ -1180,16 +1258,16 @@ def reports_revenue(
             reports_api = ReportsAPI(client)
 
             api_resolution = RESOLUTION_MAP[resolution]
-            pl_report = reports_api.get_profit_and_loss(
-                start_date=start_date,
-                end_date=end_date,
-                resolution=api_resolution,
-                currency_code=currency,
-            )
-
-            ar_report = reports_api.get_ar_aging(
-                end_date=end_date,
-                currency_code=currency,
+            pl_report, ar_report = _run_concurrently(
+                client,
+                partial(
+                    reports_api.get_profit_and_loss,
+                    start_date=start_date,
+                    end_date=end_date,
+                    resolution=api_resolution,
+                    currency_code=currency,
+                ),
+                partial(reports_api.get_ar_aging, end_date=end_date, currency_code=currency),
             )
             ar_balance = ar_report.totals.total.amount
             report_currency = currency or ar_report.currency_code
@@ -1201,15 +1279,9 @@ def reports_revenue(
                 return
 
             if as_json:
-                import json
-                from .api.reports import calculate_dso, get_days_in_period
-
+                dso_values = calculate_period_dso(ar_balance, pl_report.income, api_resolution)
                 periods_output = []
-                for period in pl_report.income:
-                    start = datetime.strptime(period.start_date, "%Y-%m-%d")
-                    days = get_days_in_period(start.year, start.month, api_resolution)
-                    dso = calculate_dso(ar_balance, period.total.amount, days)
-
+                for period, dso in zip(pl_report.income, dso_values):
                     periods_output.append({
                         "start_date": period.start_date,
                         "end_date": period.end_date,
@@ -1217,14 +1289,14 @@ def reports_revenue(
                         "dso": float(dso) if dso else None,
                     })
 
-                output = {
+                json_output = {
                     "periods": periods_output,
-                    "total_revenue": float(sum(p.total.amount for p in pl_report.income)),
+                    "total_revenue": float(sum((p.total.amount for p in pl_report.income), Decimal("0"))),
                     "ar_balance": float(ar_balance),
                     "currency": report_currency,
                     "resolution": resolution,
                 }
-                click.echo(json.dumps(output, indent=2))
+                _print_json(json_output)
             else:
                 table = RevenueSummaryTable(console)
                 table.print_report(pl_report, ar_balance, report_currency)
@@ -1272,10 +1344,6 @@ def reports_expense_summary(
 
         with FreshBooksClient(config) as client:
             expenses_api = ExpensesAPI(client)
-            all_expenses = expenses_api.list_all(
-                date_min=start_date,
-                date_max=end_date,
-            )
 
             def aggregate_expenses(expenses, group_key_fn):
                 """Aggregate expenses by currency, then by group key."""
@@ -1283,11 +1351,8 @@ def reports_expense_summary(
                 for expense in expenses:
                     currency = expense.currency_code
                     group_key = group_key_fn(expense)
-                    if currency not in result:
-                        result[currency] = {}
-                    if group_key not in result[currency]:
-                        result[currency][group_key] = Decimal("0")
-                    result[currency][group_key] += expense.total_amount
+                    totals = result.setdefault(currency, {})
+                    totals[group_key] = totals.get(group_key, Decimal("0")) + expense.total_amount
                 return result
 
             if by_category:
@@ -1312,7 +1377,10 @@ def reports_expense_summary(
                         return f"{year}-Q{quarter}"
                     return year_month
 
-            aggregated = aggregate_expenses(all_expenses, group_key_fn)
+            aggregated = aggregate_expenses(
+                expenses_api.iter_all(date_min=start_date, date_max=end_date),
+                group_key_fn,
+            )
 
             if export == "csv":
                 from .ui.exporters import export_expense_summary_csv
@@ -1330,9 +1398,9 @@ def reports_expense_summary(
                 for currency, groups in sorted(aggregated.items()):
                     json_output["currencies"][currency] = {
                         "groups": {k: float(v) for k, v in sorted(groups.items())},
-                        "total": float(sum(groups.values()))
+                        "total": float(sum(groups.values(), Decimal("0")))
                     }
-                print(json.dumps(json_output, indent=2))
+                _print_json(json_output)
                 return
 
             if not aggregated:
@@ -1412,23 +1480,26 @@ def expenses_list(start_date: Optional[str], end_date: Optional[str], category:
                 status=status_code,
             )
 
-            all_expenses = sorted(all_expenses, key=lambda e: e.date, reverse=True)[:limit]
+            all_expenses = heapq.nlargest(limit, all_expenses, key=lambda e: e.date)
 
             if as_json:
-                total_amount = sum(e.total_amount for e in all_expenses)
+                total_amount = sum((e.total_amount for e in all_expenses), Decimal("0"))
+                category_names = expenses_api.get_category_names(
+                    e.categoryid for e in all_expenses if e.categoryid
+                )
                 output = {
                     "expenses": [
                         {
                             "id": exp.id,
                             "date": exp.date,
                             "vendor": exp.vendor,
-                            "category": expenses_api.get_category_name(exp.categoryid) if exp.categoryid else None,
+                            "category": category_names.get(exp.categoryid),
                             "category_id": exp.categoryid,
                             "status": exp.display_status,
                             "currency": exp.currency_code,
                             "amount": float(exp.amount),
-                            "tax1": float(exp.taxAmount1) if exp.taxAmount1 else None,
-                            "tax2": float(exp.taxAmount2) if exp.taxAmount2 else None,
+                            "tax1": _float_or_none(exp.taxAmount1),
+                            "tax2": _float_or_none(exp.taxAmount2),
                             "total_amount": float(exp.total_amount),
                             "notes": exp.notes,
                             "invoice_id": exp.invoiceid,
@@ -1438,7 +1509,7 @@ def expenses_list(start_date: Optional[str], end_date: Optional[str], category:
                     "total_amount": float(total_amount),
                     "count": len(all_expenses),
                 }
-                print(json.dumps(output, indent=2))
+                _print_json(output)
                 return
 
             if not all_expenses:
@@ -1495,9 +1566,9 @@ def expenses_show(expense_id: int, as_json: bool):
                         "currency": expense.currency_code,
                         "amount": float(expense.amount),
                         "tax1_name": expense.taxName1,
-                        "tax1_amount": float(expense.taxAmount1) if expense.taxAmount1 else None,
+                        "tax1_amount": _float_or_none(expense.taxAmount1),
                         "tax2_name": expense.taxName2,
-                        "tax2_amount": float(expense.taxAmount2) if expense.taxAmount2 else None,
+                        "tax2_amount": _float_or_none(expense.taxAmount2),
                         "total_amount": float(expense.total_amount),
                         "notes": expense.notes,
                         "invoice_id": expense.invoiceid,
@@ -1506,7 +1577,7 @@ def expenses_show(expense_id: int, as_json: bool):
                         "staff_id": expense.staffid,
                     }
                 }
-                print(json.dumps(output, indent=2))
+                _print_json(output)
                 return
 
             expense_table = ExpenseTable(console)
@@ -1521,8 +1592,6 @@ def expenses_show(expense_id: int, as_json: bool):
 @click.option("--output", "-o", help="Output file path (default: ~/.config/freshbooks-tools/rates.yaml)")
 def rates_init(output: Optional[str]):
     """Generate a rates.yaml template with all team members."""
-    from .config import CONFIG_DIR, RATES_FILE, ensure_config_dir
-
     try:
         config = load_config()
 
@@ -1576,6 +1645,7 @@ def rates_init(output: Optional[str]):
 
             with open(output_path, "w") as f:
                 f.write(content)
+            load_config.cache_clear()
 
             console.print(f"\n[green]Rates template generated:[/green] {output_path}")
             console.print(f"\nFound {len(all_members)} team members.")
@@ -1622,7 +1692,7 @@ def team_list(as_json: bool):
                         "billable_rate": float(billable_rate) if billable_rate else None,
                         "cost_rate": float(cost_rate) if cost_rate else None,
                     })
-                print(json.dumps({"members": members_list}, indent=2))
+                _print_json({"members": members_list})
                 return
 
             console.print("\n[dim]Fetching team members from projects...[/dim]")
@@ -2,20 +2,31 @@
 
 import json
 import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 import yaml
 from dotenv import load_dotenv
-from platformdirs import user_config_dir
+from platformdirs import user_cache_dir, user_config_dir
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 APP_NAME = "freshbooks-tools"
 CONFIG_DIR = Path(user_config_dir(APP_NAME))
 TOKENS_FILE = CONFIG_DIR / "tokens.json"
 RATES_FILE = CONFIG_DIR / "rates.yaml"
+CACHE_DIR = Path(user_cache_dir(APP_NAME))
+RATES_CACHE_NAME = "rates.json"
+CACHE_MAX_AGE = 7 * 86400
 
 
 @dataclass
@@ -103,6 +114,43 @@ class RatesConfig:
             return self.billable_rates[str_id]
         return None
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization (rates as strings)."""
+        def dump(rate: Optional[Decimal]) -> Optional[str]:
+            return None if rate is None else str(rate)
+
+        return {
+            "cost_rates": {k: str(v) for k, v in self.cost_rates.items()},
+            "billable_rates": {k: str(v) for k, v in self.billable_rates.items()},
+            "default_cost_rate": dump(self.default_cost_rate),
+            "default_billable_rate": dump(self.default_billable_rate),
+            "members": {
+                str(identity_id): {
+                    k: v if k == "name" else str(v) for k, v in info.items()
+                }
+                for identity_id, info in self.members.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RatesConfig":
+        """Create from a dictionary produced by to_dict()."""
+        def load(rate: Optional[str]) -> Optional[Decimal]:
+            return None if rate is None else Decimal(rate)
+
+        return cls(
+            cost_rates={k: Decimal(v) for k, v in data["cost_rates"].items()},
+            billable_rates={k: Decimal(v) for k, v in data["billable_rates"].items()},
+            default_cost_rate=load(data["default_cost_rate"]),
+            default_billable_rate=load(data["default_billable_rate"]),
+            members={
+                int(identity_id): {
+                    k: v if k == "name" else Decimal(v) for k, v in info.items()
+                }
+                for identity_id, info in data["members"].items()
+            },
+        )
+
 
 @dataclass
 class Config:
@@ -115,6 +163,7 @@ class Config:
     rates: RatesConfig = field(default_factory=RatesConfig)
     account_id: Optional[str] = None
     business_id: Optional[int] = None
+    use_cache: bool = True
 
 
 def ensure_config_dir() -> None:
@@ -167,12 +216,14 @@ def save_tokens(tokens: Tokens) -> None:
     """Save tokens to config directory."""
     ensure_config_dir()
     _write_secure_json(TOKENS_FILE, tokens.to_dict())
+    load_config.cache_clear()
 
 
 def delete_tokens() -> None:
     """Remove stored tokens."""
     if TOKENS_FILE.exists():
         TOKENS_FILE.unlink()
+    load_config.cache_clear()
 
 
 def load_rates_config() -> RatesConfig:
@@ -199,13 +250,35 @@ def load_rates_config() -> RatesConfig:
         name: "Joseph Ottinger"
         cost_rate: 75.00
     ```
+
+    The parsed result is cached as JSON keyed on the file's mtime and size,
+    so the YAML is only re-parsed after the file changes.
     """
-    if not RATES_FILE.exists():
+    try:
+        stat = RATES_FILE.stat()
+    except FileNotFoundError:
         return RatesConfig()
 
+    use_cache = not os.getenv("FRESHBOOKS_NO_CACHE")
+    key = [stat.st_mtime_ns, stat.st_size]
+    if use_cache:
+        cached = load_cache(RATES_CACHE_NAME, float("inf"))
+        if cached is not None and cached.get("key") == key:
+            try:
+                return RatesConfig.from_dict(cached["rates"])
+            except (KeyError, TypeError, ValueError, ArithmeticError):
+                pass
+
+    rates = _parse_rates_file()
+    if use_cache:
+        save_cache(RATES_CACHE_NAME, {"key": key, "rates": rates.to_dict()})
+    return rates
+
+
+def _parse_rates_file() -> RatesConfig:
+    """Parse RATES_FILE, returning empty rates if it is malformed."""
     try:
-        with open(RATES_FILE) as f:
-            data = yaml.safe_load(f) or {}
+        data = yaml.load(RATES_FILE.read_bytes(), Loader=_SafeLoader) or {}
 
         cost_rates = {}
         for key, rate in data.get("cost_rates", {}).items():
@@ -245,8 +318,13 @@ def load_rates_config() -> RatesConfig:
         return RatesConfig()
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load complete application configuration."""
+    """Load complete application configuration.
+
+    Memoized for the life of the process; save_tokens and delete_tokens
+    clear it so the next call re-reads from disk.
+    """
     client_id, client_secret, redirect_uri = load_env_config()
     tokens = load_tokens()
     rates = load_rates_config()
@@ -257,6 +335,7 @@ def load_config() -> Config:
         redirect_uri=redirect_uri,
         tokens=tokens,
         rates=rates,
+        use_cache=not os.getenv("FRESHBOOKS_NO_CACHE"),
     )
 
 
@@ -279,3 +358,51 @@ def load_account_info() -> tuple[Optional[str], Optional[int]]:
         return data.get("account_id"), data.get("business_id")
     except (json.JSONDecodeError, KeyError):
         return None, None
+
+
+def load_cache(name: str, max_age: float) -> Optional[Any]:
+    """Load a JSON cache file if it exists and is younger than max_age seconds."""
+    path = CACHE_DIR / name
+    try:
+        if time.time() - path.stat().st_mtime >= max_age:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def save_cache(name: str, data: Any) -> None:
+    """Write data to a JSON cache file, ignoring filesystem errors.
+
+    Cached API responses carry account data, so like the token file the
+    cache is owner-only: the directory 0700 and each file 0600.
+    """
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(CACHE_DIR, 0o700)
+        fd = os.open(CACHE_DIR / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), 0o600)
+            f.write(orjson.dumps(data))
+    except OSError:
+        pass
+
+
+def prune_cache(max_age: float = CACHE_MAX_AGE) -> None:
+    """Remove cache files not written for max_age seconds, ignoring filesystem errors."""
+    cutoff = time.time() - max_age
+    try:
+        paths = list(CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for path in paths:
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def delete_cache(name: str) -> None:
+    """Remove a cache file if present."""
+    (CACHE_DIR / name).unlink(missing_ok=True)
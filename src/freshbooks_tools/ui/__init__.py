@@ -1,10 +1,18 @@
 """UI components for terminal output."""
 
 from .tables import TimeEntryTable, InvoiceTable
-from .invoice_browser import InvoiceBrowserApp
 
 __all__ = [
     "TimeEntryTable",
     "InvoiceTable",
     "InvoiceBrowserApp",
 ]
+
+
+def __getattr__(name: str):
+    """Import the Textual invoice browser only when it is first requested."""
+    if name == "InvoiceBrowserApp":
+        from .invoice_browser import InvoiceBrowserApp
+
+        return InvoiceBrowserApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 """CSV export utilities for financial reports."""
 
 import csv
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from io import StringIO
 from typing import TYPE_CHECKING, Optional
@@ -158,7 +158,7 @@ def export_revenue_csv(report: "ProfitLossReport", ar_balance: Decimal, currency
     Returns:
         Path to the exported CSV file
     """
-    from ..api.reports import calculate_dso, get_days_in_period
+    from ..api.reports import calculate_period_dso
 
     filepath = output or generate_csv_filename('revenue_summary')
 
@@ -174,9 +174,10 @@ def export_revenue_csv(report: "ProfitLossReport", ar_balance: Decimal, currency
     ])
 
     # Write period rows
-    for period in report.income:
+    dso_values = calculate_period_dso(ar_balance, report.income, report.resolution)
+    for period, dso in zip(report.income, dso_values):
         # Format period label
-        start = datetime.strptime(period.start_date, "%Y-%m-%d")
+        start = date.fromisoformat(period.start_date)
         if report.resolution == "m":
             period_label = start.strftime("%b %Y")
         elif report.resolution == "q":
@@ -187,9 +188,6 @@ def export_revenue_csv(report: "ProfitLossReport", ar_balance: Decimal, currency
         else:
             period_label = f"{period.start_date} - {period.end_date}"
 
-        # Calculate DSO
-        days = get_days_in_period(start.year, start.month, report.resolution)
-        dso = calculate_dso(ar_balance, period.total.amount, days)
         dso_str = f"{dso:.1f}" if dso is not None else "N/A"
 
         writer.writerow([
@@ -1,7 +1,7 @@
 """Rich table formatters for CLI output."""
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date
 from decimal import Decimal
 from difflib import get_close_matches
 from typing import TYPE_CHECKING, Optional
@@ -156,9 +156,10 @@ class TimeEntryTable:
         self.console.print(table)
 
         if show_rates and rows:
-            total_hours = sum(r.hours for r in rows)
-            total_billable = sum(r.billable_amount or Decimal("0") for r in rows)
-            total_cost = sum(r.cost_amount or Decimal("0") for r in rows)
+            zero = Decimal("0")
+            total_hours = sum((r.hours for r in rows), zero)
+            total_billable = sum((r.billable_amount for r in rows if r.billable_amount), zero)
+            total_cost = sum((r.cost_amount for r in rows if r.cost_amount), zero)
             profit = total_billable - total_cost
             margin = (profit / total_billable * 100) if total_billable else Decimal("0")
 
@@ -167,8 +168,10 @@ class TimeEntryTable:
             self.console.print(f"  Total Hours: [magenta]{total_hours:.2f}[/magenta]")
             self.console.print(f"  Total Billable: [green]${total_billable:.2f}[/green]")
             self.console.print(f"  Total Cost: [red]${total_cost:.2f}[/red]")
-            self.console.print(f"  Profit: [{'green' if profit >= 0 else 'red'}]${profit:.2f}[/{'green' if profit >= 0 else 'red'}]")
-            self.console.print(f"  Margin: [{'green' if margin >= 0 else 'red'}]{margin:.1f}%[/{'green' if margin >= 0 else 'red'}]")
+            color = "green" if profit >= 0 else "red"
+            self.console.print(f"  Profit: [{color}]${profit:.2f}[/{color}]")
+            margin_color = "green" if margin >= 0 else "red"
+            self.console.print(f"  Margin: [{margin_color}]{margin:.1f}%[/{margin_color}]")
 
 
 class InvoiceTable:
@@ -695,7 +698,7 @@ class RevenueSummaryTable:
 
     def _format_period_label(self, start_date: str, end_date: str, resolution: str) -> str:
         """Format period label based on resolution."""
-        start = datetime.strptime(start_date, "%Y-%m-%d")
+        start = date.fromisoformat(start_date)
 
         if resolution == "m":
             return start.strftime("%b %Y")
@@ -737,7 +740,7 @@ class RevenueSummaryTable:
             ar_balance: Current AR balance for DSO calculation
             currency: Currency code for display
         """
-        from ..api.reports import calculate_dso, get_days_in_period
+        from ..api.reports import calculate_period_dso
 
         if not report.income:
             self.console.print("[yellow]No revenue data found for the specified period.[/yellow]")
@@ -750,7 +753,8 @@ class RevenueSummaryTable:
 
         total_revenue = Decimal("0")
 
-        for period in report.income:
+        dso_values = calculate_period_dso(ar_balance, report.income, report.resolution)
+        for period, dso in zip(report.income, dso_values):
             period_label = self._format_period_label(
                 period.start_date, period.end_date, report.resolution
             )
@@ -758,10 +762,6 @@ class RevenueSummaryTable:
             revenue = period.total.amount
             total_revenue += revenue
 
-            start = datetime.strptime(period.start_date, "%Y-%m-%d")
-            days = get_days_in_period(start.year, start.month, report.resolution)
-            dso = calculate_dso(ar_balance, revenue, days)
-
             table.add_row(
                 period_label,
                 f"${revenue:,.2f}",
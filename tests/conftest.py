@@ -53,3 +53,11 @@ def profit_loss_response():
 def user_me_response():
     """Load user identity API response fixture."""
     return load_fixture("user_me_response.json")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point the on-disk API cache at a per-test temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("freshbooks_tools.config.CACHE_DIR", cache_dir)
+    return cache_dir
@@ -0,0 +1,87 @@
+"""Unit tests for configuration loading."""
+
+import os
+import stat
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from freshbooks_tools import config
+from freshbooks_tools.config import load_cache, load_rates_config, prune_cache, save_cache
+
+RATES_YAML = """\
+default_cost_rate: 50.00
+cost_rates:
+  "john@example.com": 55.50
+members:
+  340305:
+    name: "Andrew Lombardi"
+    cost_rate: 100.00
+    billable_rate: 288.00
+"""
+
+
+@pytest.fixture
+def rates_file(tmp_path, monkeypatch):
+    """Write a rates.yaml and point RATES_FILE at it."""
+    path = tmp_path / "rates.yaml"
+    path.write_text(RATES_YAML)
+    monkeypatch.setattr("freshbooks_tools.config.RATES_FILE", path)
+    return path
+
+
+class TestLoadRatesConfig:
+    """Tests for load_rates_config() and its parsed-rates cache."""
+
+    def test_unchanged_file_is_served_from_cache(self, rates_file, isolated_cache_dir):
+        """Verify a second load reuses the cached rates without parsing YAML."""
+        first = load_rates_config()
+
+        with patch.object(config, "_parse_rates_file", side_effect=AssertionError("re-parsed")):
+            second = load_rates_config()
+
+        assert second == first
+        assert second.default_cost_rate == Decimal("50.0")
+        assert second.members[340305] == {
+            "name": "Andrew Lombardi",
+            "cost_rate": Decimal("100.0"),
+            "billable_rate": Decimal("288.0"),
+        }
+
+    def test_modified_file_is_reparsed(self, rates_file, isolated_cache_dir):
+        """Verify editing rates.yaml invalidates the cached rates."""
+        load_rates_config()
+        rates_file.write_text("default_cost_rate: 60.00\n")
+        st = rates_file.stat()
+        os.utime(rates_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+        rates = load_rates_config()
+
+        assert rates.default_cost_rate == Decimal("60.0")
+        assert rates.members == {}
+
+
+class TestResponseCache:
+    """Tests for the on-disk JSON cache helpers."""
+
+    def test_cache_files_are_owner_only(self, isolated_cache_dir):
+        """Verify the cache directory is 0700 and cache files are 0600."""
+        save_cache("entry.json", {"value": 1})
+
+        assert stat.S_IMODE(isolated_cache_dir.stat().st_mode) == 0o700
+        assert stat.S_IMODE((isolated_cache_dir / "entry.json").stat().st_mode) == 0o600
+        assert load_cache("entry.json", 60) == {"value": 1}
+
+    def test_prune_removes_only_stale_files(self, isolated_cache_dir):
+        """Verify prune_cache deletes entries older than max_age and keeps fresh ones."""
+        save_cache("stale.json", {"value": 1})
+        save_cache("fresh.json", {"value": 2})
+        old = time.time() - 3600
+        os.utime(isolated_cache_dir / "stale.json", (old, old))
+
+        prune_cache(max_age=60)
+
+        assert not (isolated_cache_dir / "stale.json").exists()
+        assert load_cache("fresh.json", 60) == {"value": 2}
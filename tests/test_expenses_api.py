@@ -0,0 +1,151 @@
+"""Unit tests for ExpensesAPI module."""
+
+from decimal import Decimal
+import re
+
+from freshbooks_tools.api.client import FreshBooksClient
+from freshbooks_tools.api.expenses import ExpensesAPI, _parse_expense
+
+
+def expenses_page(expense_ids: list[int], total: int) -> dict:
+    """Build an expenses list API response."""
+    return {
+        "response": {
+            "result": {
+                "expenses": [
+                    {
+                        "expenseid": expense_id,
+                        "amount": {"amount": "10.00", "code": "USD"},
+                        "date": "2026-01-15",
+                    }
+                    for expense_id in expense_ids
+                ],
+                "total": total,
+            }
+        }
+    }
+
+
+class TestListAll:
+    """Tests for ExpensesAPI.list_all()."""
+
+    def test_list_all_fetches_every_page_in_order(self, httpx_mock, mock_config):
+        """Verify remaining pages are fetched after page 1 and merged in page order."""
+        for page, ids in ((1, list(range(1, 101))), (2, list(range(101, 201))), (3, [201])):
+            httpx_mock.add_response(
+                url=re.compile(rf".*/expenses/expenses\?.*page={page}&.*"),
+                json=expenses_page(ids, total=201),
+            )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            api = ExpensesAPI(client)
+            expenses = api.list_all()
+
+        assert [e.id for e in expenses] == list(range(1, 202))
+        assert expenses[0].amount == Decimal("10.00")
+
+    def test_list_all_single_page(self, httpx_mock, mock_config):
+        """Verify a single page result makes exactly one request."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/expenses/expenses.*"),
+            json=expenses_page([1, 2], total=2),
+        )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            api = ExpensesAPI(client)
+            expenses = api.list_all()
+
+        assert [e.id for e in expenses] == [1, 2]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_iter_all_yields_first_page_before_fetching_rest(self, httpx_mock, mock_config):
+        """Verify iter_all streams page 1 before requesting later pages."""
+        for page, ids in ((1, list(range(1, 101))), (2, [101])):
+            httpx_mock.add_response(
+                url=re.compile(rf".*/expenses/expenses\?.*page={page}&.*"),
+                json=expenses_page(ids, total=101),
+            )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            expenses = ExpensesAPI(client).iter_all()
+
+            assert next(expenses).id == 1
+            assert len(httpx_mock.get_requests()) == 1
+            assert [e.id for e in expenses][-1] == 101
+
+
+class TestListCategories:
+    """Tests for ExpensesAPI.list_categories() disk caching."""
+
+    def test_categories_reused_across_instances(self, httpx_mock, mock_config, isolated_cache_dir):
+        """Verify a fresh ExpensesAPI loads categories from disk instead of the API."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/expenses/categories.*"),
+            json={
+                "response": {
+                    "result": {
+                        "categories": [{"categoryid": 7, "category": "Travel"}],
+                        "total": 1,
+                    }
+                }
+            },
+        )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            ExpensesAPI(client).list_categories()
+            assert ExpensesAPI(client).get_category_name(7) == "Travel"
+
+            assert (isolated_cache_dir / "categories-ABC123.json").exists()
+            ExpensesAPI(client).clear_cache()
+            assert not (isolated_cache_dir / "categories-ABC123.json").exists()
+
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestParseExpense:
+    """Tests for expense row parsing."""
+
+    def test_parses_dict_and_scalar_money_fields(self):
+        """Verify amounts and taxes accept both {"amount": ...} dicts and scalars."""
+        expense = _parse_expense({
+            "expenseid": 7,
+            "amount": {"amount": "100.50", "code": "CAD"},
+            "taxAmount1": {"amount": "5.00", "code": "CAD"},
+            "taxAmount2": "2.25",
+            "date": "2026-01-15",
+        })
+
+        assert expense.amount == Decimal("100.50")
+        assert expense.currency_code == "CAD"
+        assert expense.taxAmount1 == Decimal("5.00")
+        assert expense.taxAmount2 == Decimal("2.25")
+        assert expense.total_amount == Decimal("107.75")
+
+    def test_missing_money_fields_default(self):
+        """Verify a missing amount is zero USD and missing taxes are None."""
+        expense = _parse_expense({"expenseid": 8, "date": "2026-01-15"})
+
+        assert expense.amount == Decimal("0")
+        assert expense.currency_code == "USD"
+        assert expense.taxAmount1 is None
+        assert expense.taxAmount2 is None
+
+    def test_numeric_money_fields(self):
+        """Verify int and float amounts convert exactly as their decimal text."""
+        expense = _parse_expense({
+            "expenseid": 9,
+            "amount": {"amount": 12, "code": "USD"},
+            "taxAmount1": 0.1,
+            "date": "2026-01-15",
+        })
+
+        assert expense.amount == Decimal("12")
+        assert expense.taxAmount1 == Decimal("0.1")
@@ -1,12 +1,15 @@
 """Unit tests for FreshBooksClient error handling."""
 
 import re
+import time
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import httpx
 import pytest
 
 from freshbooks_tools.api.client import FreshBooksClient
+from freshbooks_tools.config import Tokens
 from freshbooks_tools.exceptions import (
     APIResponseError,
     AuthenticationError,
@@ -89,6 +92,13 @@ class TestErrorHandling:
 
             assert "500" in str(exc_info.value)
 
+    def test_204_put_returns_empty_dict(self, httpx_mock, mock_config):
+        """Verify a successful response without a body decodes to an empty dict."""
+        httpx_mock.add_response(url=re.compile(r".*"), status_code=204)
+
+        with FreshBooksClient(mock_config) as client:
+            assert client.put("https://api.freshbooks.com/test/endpoint", {"a": 1}) == {}
+
     def test_timeout_raises_network_error(self, httpx_mock, mock_config):
         """Verify timeout raises NetworkError."""
         httpx_mock.add_exception(
@@ -103,3 +113,134 @@ class TestErrorHandling:
                 client.get("https://api.freshbooks.com/test/endpoint")
 
             assert "timed out" in str(exc_info.value).lower()
+
+
+class TestAuthHeaders:
+    """Tests for FreshBooksClient authorization header caching."""
+
+    def test_headers_reused_while_token_unchanged(self, mock_config):
+        """Verify the same header dict is returned until the access token changes."""
+        with FreshBooksClient(mock_config) as client:
+            first = client.headers
+            assert client.headers is first
+            assert first == {"Authorization": "Bearer test_access_token"}
+
+            mock_config.tokens.access_token = "new_access_token"
+            assert client.headers == {"Authorization": "Bearer new_access_token"}
+
+    def test_retry_after_refresh_uses_new_token(self, httpx_mock, mock_config, mock_tokens):
+        """Verify the retried request carries the refreshed token without re-validating."""
+        url = "https://api.freshbooks.com/test/endpoint"
+        httpx_mock.add_response(url=url, status_code=401)
+        httpx_mock.add_response(url=url, json={"ok": True})
+        refreshed = Tokens(access_token="fresh", refresh_token="r")
+
+        with FreshBooksClient(mock_config) as client, \
+                patch("freshbooks_tools.api.client.refresh_access_token", return_value=refreshed), \
+                patch("freshbooks_tools.api.client.save_tokens"), \
+                patch("freshbooks_tools.api.client.ensure_valid_token", return_value=mock_tokens) as ensure:
+            assert client.get(url) == {"ok": True}
+
+        assert ensure.call_count == 1
+        assert httpx_mock.get_requests()[-1].headers["Authorization"] == "Bearer fresh"
+
+    def test_concurrent_401s_refresh_once(self, httpx_mock, mock_config):
+        """Verify pages rejected together share a single token refresh."""
+        def respond(request: httpx.Request) -> httpx.Response:
+            if request.headers["Authorization"] != "Bearer fresh":
+                return httpx.Response(401)
+            return httpx.Response(200, json={"page": int(request.url.params["page"])})
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        refreshed = Tokens(access_token="fresh", refresh_token="r")
+
+        with FreshBooksClient(mock_config) as client, \
+                patch("freshbooks_tools.api.client.refresh_access_token", return_value=refreshed) as refresh, \
+                patch("freshbooks_tools.api.client.save_tokens"):
+            pages = client.get_pages("https://api.freshbooks.com/test/list", {}, range(1, 9))
+
+        assert pages == [{"page": page} for page in range(1, 9)]
+        assert refresh.call_count == 1
+
+    def test_concurrent_expired_token_refreshes_once(self, httpx_mock, mock_config):
+        """Verify workers that all find the token expired send a single refresh request."""
+        def respond(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.05)  # keep the refresh in flight while other workers check the token
+            return httpx.Response(200, json={"access_token": "fresh", "refresh_token": "r2", "expires_in": 3600})
+
+        httpx_mock.add_callback(respond, url=re.compile(r".*/auth/oauth/token.*"), is_reusable=True)
+        mock_config.tokens.expires_at = datetime.now() - timedelta(hours=1)
+
+        with FreshBooksClient(mock_config) as client, patch("freshbooks_tools.auth.save_tokens"):
+            headers = client.map_concurrent(lambda _: client.headers, range(8))
+
+        assert headers == [{"Authorization": "Bearer fresh"}] * 8
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestResponseCache:
+    """Tests for FreshBooksClient.get(cache_ttl=...) response caching."""
+
+    def test_cached_response_reused_across_clients(self, httpx_mock, mock_config):
+        """Verify a cached GET is served from disk by a fresh client within the TTL."""
+        url = "https://api.freshbooks.com/test/report"
+        httpx_mock.add_response(url=re.compile(r".*/test/report.*"), json={"value": 1})
+
+        with FreshBooksClient(mock_config) as client:
+            assert client.get(url, {"b": 2, "a": 1}, cache_ttl=60) == {"value": 1}
+        with FreshBooksClient(mock_config) as client:
+            assert client.get(url, {"a": 1, "b": 2}, cache_ttl=60) == {"value": 1}
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_uncached_get_always_requests(self, httpx_mock, mock_config):
+        """Verify GETs without cache_ttl bypass the response cache."""
+        url = "https://api.freshbooks.com/test/report"
+        httpx_mock.add_response(url=url, json={"value": 1})
+        httpx_mock.add_response(url=url, json={"value": 2})
+
+        with FreshBooksClient(mock_config) as client:
+            assert client.get(url) == {"value": 1}
+            assert client.get(url) == {"value": 2}
+
+    def test_use_cache_disabled_ignores_cache_ttl(self, httpx_mock, mock_config):
+        """Verify a config with use_cache off always requests fresh data."""
+        url = "https://api.freshbooks.com/test/report"
+        httpx_mock.add_response(url=url, json={"value": 1})
+        httpx_mock.add_response(url=url, json={"value": 2})
+        mock_config.use_cache = False
+
+        with FreshBooksClient(mock_config) as client:
+            assert client.get(url, cache_ttl=60) == {"value": 1}
+            assert client.get(url, cache_ttl=60) == {"value": 2}
+
+    def test_in_memory_cache_is_bounded(self, httpx_mock, mock_config):
+        """Verify only the most recent RESPONSE_CACHE_SIZE bodies stay in memory."""
+        httpx_mock.add_response(url=re.compile(r".*/test/page.*"), json={}, is_reusable=True)
+
+        with FreshBooksClient(mock_config) as client:
+            for page in range(client.RESPONSE_CACHE_SIZE + 5):
+                client.get("https://api.freshbooks.com/test/page", {"page": page}, cache_ttl=60)
+
+            assert len(client._response_cache) == client.RESPONSE_CACHE_SIZE
+
+    def test_stale_entry_revalidated_with_etag(self, httpx_mock, mock_config):
+        """Verify an expired entry sends If-None-Match and reuses the body on 304."""
+        url = "https://api.freshbooks.com/test/report"
+        httpx_mock.add_response(url=url, json={"value": 1}, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+        with FreshBooksClient(mock_config) as client:
+            assert client.get(url, cache_ttl=1e-9) == {"value": 1}
+            assert client.get(url, cache_ttl=1e-9) == {"value": 1}
+
+
+class TestConnectionPool:
+    """Tests for FreshBooksClient HTTP client reuse."""
+
+    def test_concurrent_first_use_shares_one_client(self, mock_config):
+        """Verify worker threads racing on first access get the same pooled client."""
+        with FreshBooksClient(mock_config) as client:
+            seen = client.map_concurrent(lambda _: client.client, range(8))
+
+            assert all(c is seen[0] for c in seen)
@@ -0,0 +1,115 @@
+"""Unit tests for InvoicesAPI module."""
+
+from decimal import Decimal
+import re
+
+from freshbooks_tools.api.client import FreshBooksClient
+from freshbooks_tools.api.invoices import InvoicesAPI, _parse_invoice
+
+
+def invoices_page(invoice_ids: list[int], total: int) -> dict:
+    """Build an invoices list API response."""
+    return {
+        "response": {
+            "result": {
+                "invoices": [
+                    {
+                        "invoiceid": invoice_id,
+                        "customerid": 42,
+                        "create_date": "2026-01-15",
+                        "status": 2,
+                    }
+                    for invoice_id in invoice_ids
+                ],
+                "total": total,
+            }
+        }
+    }
+
+
+class TestListInvoices:
+    """Tests for InvoicesAPI.list_invoices()."""
+
+    def test_numeric_json_amounts_keep_decimal_precision(self, httpx_mock, mock_config):
+        """Verify amounts decoded as JSON numbers convert to the exact decimal text."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/invoices/invoices.*"),
+            content=(
+                b'{"response": {"result": {"total": 1, "invoices": [{"invoiceid": 1,'
+                b' "customerid": 42, "create_date": "2026-01-15", "status": 2,'
+                b' "amount": {"amount": 1234.57, "code": "USD"}, "outstanding": 0.1}]}}}'
+            ),
+        )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            invoices, total = InvoicesAPI(client).list_invoices()
+
+        assert total == 1
+        assert invoices[0].amount == Decimal("1234.57")
+        assert invoices[0].outstanding == Decimal("0.1")
+
+    def test_invoice_number_is_sent_as_search_filter(self, httpx_mock, mock_config):
+        """Verify an invoice number lookup is filtered server-side."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/invoices/invoices.*"),
+            json=invoices_page([7], total=1),
+        )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            InvoicesAPI(client).list_invoices(invoice_number="0000007")
+
+        request = httpx_mock.get_requests()[0]
+        assert request.url.params["search[invoice_number]"] == "0000007"
+
+
+class TestListAllInvoices:
+    """Tests for InvoicesAPI.list_all_invoices()."""
+
+    def test_fetches_every_page_in_order(self, httpx_mock, mock_config):
+        """Verify pages after the first are fetched and merged in page order."""
+        for page, ids in ((1, list(range(1, 101))), (2, list(range(101, 201))), (3, [201])):
+            httpx_mock.add_response(
+                url=re.compile(rf".*/invoices/invoices\?.*page={page}&.*"),
+                json=invoices_page(ids, total=201),
+            )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            invoices = InvoicesAPI(client).list_all_invoices()
+
+        assert [i.id for i in invoices] == list(range(1, 202))
+
+
+class TestParseInvoice:
+    """Tests for invoice row parsing."""
+
+    def test_parses_lines_and_payments(self):
+        """Verify included lines and payments are parsed with their money fields."""
+        invoice = _parse_invoice({
+            "invoiceid": 5,
+            "customerid": 42,
+            "create_date": "2026-01-15",
+            "status": 4,
+            "amount": {"amount": "150.00", "code": "USD"},
+            "paid": {"amount": "150.00", "code": "USD"},
+            "outstanding": {"amount": "0.00", "code": "USD"},
+            "discount_value": "0",
+            "lines": [
+                {"lineid": 1, "qty": "3", "unit_cost": {"amount": "50.00"}, "amount": {"amount": "150.00"}},
+            ],
+            "payments": [
+                {"paymentid": 9, "invoiceid": 5, "amount": "150.00", "date": "2026-01-20"},
+            ],
+        })
+
+        assert invoice.amount == Decimal("150.00")
+        assert invoice.outstanding == Decimal("0.00")
+        assert invoice.discount_value == Decimal("0")
+        assert invoice.lines[0].qty == Decimal("3")
+        assert invoice.lines[0].unit_cost == Decimal("50.00")
+        assert invoice.payments[0].amount == Decimal("150.00")
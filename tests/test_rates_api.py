@@ -0,0 +1,57 @@
+"""Unit tests for RatesAPI module."""
+
+from decimal import Decimal
+import re
+from unittest.mock import patch
+
+from freshbooks_tools.api.client import FreshBooksClient
+from freshbooks_tools.api.rates import RatesAPI
+from freshbooks_tools.api.team import TeamAPI
+
+
+class TestWarmServiceRates:
+    """Tests for RatesAPI.warm_service_rates()."""
+
+    def test_prefetches_each_distinct_service_once(self, httpx_mock, mock_config):
+        """Verify distinct uncached services are fetched once and then served from cache."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/team_member_rates.*"),
+            json={"team_member_rates": [{"identity_id": 1, "rate": "90"}]},
+        )
+        for service_id, rate in ((10, "100"), (20, "150")):
+            httpx_mock.add_response(
+                url=re.compile(rf".*/service/{service_id}/rate.*"),
+                json={"service_rate": {"rate": rate}},
+            )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            rates_api = RatesAPI(client, TeamAPI(client), mock_config.rates)
+
+            rates_api.warm_service_rates([10, 20, 10, None])
+            assert len(httpx_mock.get_requests()) == 3
+
+            assert rates_api.get_billable_rate(1, 20) == Decimal("150")
+            assert rates_api.get_billable_rate(1) == Decimal("90")
+            assert len(httpx_mock.get_requests()) == 3
+
+
+class TestBulkRates:
+    """Tests for RatesAPI batch rate resolution."""
+
+    def test_billable_rates_resolved_once_per_pair(self, mock_config):
+        """Verify each distinct (identity_id, service_id) pair is resolved once."""
+        calls = []
+
+        def fake_rate(self, identity_id, service_id=None):
+            calls.append((identity_id, service_id))
+            return Decimal(identity_id * 100)
+
+        with FreshBooksClient(mock_config) as client, \
+                patch.object(RatesAPI, "get_billable_rate", fake_rate):
+            rates_api = RatesAPI(client, TeamAPI(client), mock_config.rates)
+            rates = rates_api.get_billable_rates([(1, None), (2, 5), (1, None), (2, 5)])
+
+        assert rates == {(1, None): Decimal("100"), (2, 5): Decimal("200")}
+        assert sorted(calls, key=str) == [(1, None), (2, 5)]
@@ -6,7 +6,12 @@ import re
 import pytest
 
 from freshbooks_tools.api.client import FreshBooksClient
-from freshbooks_tools.api.reports import ReportsAPI, calculate_dso, get_days_in_period
+from freshbooks_tools.api.reports import (
+    ReportsAPI,
+    calculate_dso,
+    calculate_period_dso,
+    get_days_in_period,
+)
 from freshbooks_tools.models import AccountAgingReport, ProfitLossReport
 
 
@@ -145,6 +150,23 @@ class TestCalculateDso:
         assert result is None
 
 
+class TestCalculatePeriodDso:
+    """Tests for calculate_period_dso() batch helper."""
+
+    def test_matches_scalar_calculation_per_period(self, profit_loss_response):
+        """Test batch DSO equals calculate_dso() for each period, in order."""
+        report = ProfitLossReport(**profit_loss_response["response"]["result"]["profit_and_loss"])
+        ar_balance = Decimal("12345.67")
+
+        expected = []
+        for period in report.income:
+            year, month = int(period.start_date[:4]), int(period.start_date[5:7])
+            days = get_days_in_period(year, month, report.resolution)
+            expected.append(calculate_dso(ar_balance, period.total.amount, days))
+
+        assert calculate_period_dso(ar_balance, report.income, report.resolution) == expected
+
+
 class TestGetDaysInPeriod:
     """Tests for get_days_in_period() helper function."""
 
@@ -172,3 +194,8 @@ class TestGetDaysInPeriod:
         """Test yearly resolution: 2024 = 366 days (leap year)."""
         result = get_days_in_period(year=2024, month=1, resolution="y")
         assert result == 366
+
+    def test_get_days_in_period_monthly_february_leap(self):
+        """Test monthly resolution: February 2024 = 29 days (leap year)."""
+        result = get_days_in_period(year=2024, month=2, resolution="m")
+        assert result == 29
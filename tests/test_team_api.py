@@ -0,0 +1,163 @@
+"""Unit tests for TeamAPI module."""
+
+import re
+
+from freshbooks_tools.api.client import FreshBooksClient
+from freshbooks_tools.api.team import TeamAPI
+
+
+def member(identity_id: int, first_name: str) -> dict:
+    """Build a project group member entry."""
+    return {"identity_id": identity_id, "first_name": first_name, "last_name": "Doe"}
+
+
+class TestListProjectMembers:
+    """Tests for TeamAPI.list_project_members()."""
+
+    def test_uses_included_group_members(self, httpx_mock, mock_config):
+        """Verify expanded groups on the list response avoid per-project detail calls."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/timetracking/business/98765/projects\?.*"),
+            json={
+                "projects": [
+                    {"id": 1, "group": {"members": [member(10, "Ann"), member(11, "Bob")]}},
+                    {"id": 2, "group": {"members": [member(10, "Other")]}},
+                ]
+            },
+        )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            members = TeamAPI(client).list_project_members()
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert members[10]["first_name"] == "Ann"
+        assert members[11]["first_name"] == "Bob"
+
+    def test_falls_back_to_detail_when_group_missing(self, httpx_mock, mock_config):
+        """Verify projects listed without a group are fetched individually and merged in order."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/timetracking/business/98765/projects\?.*"),
+            json={
+                "projects": [
+                    {"id": 1},
+                    {"id": 2, "group": {"members": [member(10, "Second")]}},
+                ]
+            },
+        )
+        httpx_mock.add_response(
+            url=re.compile(r".*/timetracking/business/98765/projects/1$"),
+            json={"project": {"group": {"members": [member(10, "First")]}}},
+        )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            members = TeamAPI(client).list_project_members()
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert members[10]["first_name"] == "First"
+
+
+class TestMemberLookups:
+    """Tests for TeamAPI name and email lookups."""
+
+    def test_team_then_staff_then_project_precedence(self, httpx_mock, mock_config):
+        """Verify each identity resolves from its highest-precedence source."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/auth/api/v1/businesses/98765/team_members.*"),
+            json={"team_members": [
+                {"uuid": "u1", "identity_id": 1, "first_name": "Team", "last_name": "One",
+                 "email": "team@example.com"},
+            ]},
+        )
+        httpx_mock.add_response(
+            url=re.compile(r".*/users/staffs.*"),
+            json={"response": {"result": {"staffs": [
+                {"id": 1, "fname": "Staff", "lname": "One"},
+                {"id": 2, "fname": "Staff", "lname": "Two", "email": "staff@example.com"},
+            ]}}},
+        )
+        httpx_mock.add_response(
+            url=re.compile(r".*/timetracking/business/98765/projects\?.*"),
+            json={"projects": [{"id": 5, "group": {"members": [
+                member(2, "Project"), {"identity_id": 3, "email": "contractor@example.com"},
+            ]}}]},
+        )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            team_api = TeamAPI(client)
+
+            assert team_api.get_team_member_name(1) == "Team One"
+            assert team_api.get_team_member_email(2) == "staff@example.com"
+            assert team_api.get_team_member_name(3) == "contractor@example.com"
+            assert team_api.get_team_member_name(4) == "Unknown (4)"
+            assert team_api.get_team_member_email(4) is None
+            assert len(httpx_mock.get_requests()) == 3
+
+    def test_name_lookup_skips_project_members_on_team_hit(self, httpx_mock, mock_config):
+        """Verify a team or staff hit resolves without fetching project members."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/auth/api/v1/businesses/98765/team_members.*"),
+            json={"team_members": [
+                {"uuid": "u1", "identity_id": 1, "first_name": "Ann", "last_name": "Lee"},
+            ]},
+        )
+        httpx_mock.add_response(
+            url=re.compile(r".*/users/staffs.*"),
+            json={"response": {"result": {"staffs": [{"id": 2, "fname": "Bob", "lname": "Ray"}]}}},
+        )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            assert TeamAPI(client).get_team_member_names([1, 2]) == {1: "Ann Lee", 2: "Bob Ray"}
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_find_identity_skips_project_members_on_team_match(self, httpx_mock, mock_config):
+        """Verify a team member match does not trigger the project member fetch."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/auth/api/v1/businesses/98765/team_members.*"),
+            json={"team_members": [
+                {"uuid": "u1", "identity_id": 1, "first_name": "Ann", "last_name": "Lee"},
+            ]},
+        )
+        httpx_mock.add_response(
+            url=re.compile(r".*/users/staffs.*"),
+            json={"response": {"result": {"staffs": []}}},
+        )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            assert TeamAPI(client).find_identity_by_name("ann") == 1
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_name_search_and_lookup_share_one_roster_fetch(self, httpx_mock, mock_config):
+        """Verify the team roster parsed for a name search is reused by name lookups."""
+        httpx_mock.add_response(
+            url=re.compile(r".*/auth/api/v1/businesses/98765/team_members.*"),
+            json={"team_members": [
+                {"uuid": "u1", "identity_id": 1, "first_name": "Ann", "last_name": "Lee"},
+            ]},
+        )
+        httpx_mock.add_response(
+            url=re.compile(r".*/users/staffs.*"),
+            json={"response": {"result": {"staffs": []}}},
+        )
+        mock_config.use_cache = False
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            team_api = TeamAPI(client)
+
+            assert team_api.find_identity_by_name("ann") == 1
+            assert team_api.get_team_member_name(1) == "Ann Lee"
+
+        assert len(httpx_mock.get_requests()) == 2
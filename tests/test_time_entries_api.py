@@ -0,0 +1,54 @@
+"""Unit tests for TimeEntriesAPI module."""
+
+from datetime import datetime, timezone
+import re
+
+from freshbooks_tools.api.client import FreshBooksClient
+from freshbooks_tools.api.time_entries import TimeEntriesAPI
+
+
+def entries_page(entry_ids: list[int], total: int) -> dict:
+    """Build a time entries list API response."""
+    return {
+        "time_entries": [
+            {"id": entry_id, "identity_id": 7, "duration": 60, "started_at": "2026-01-15T09:30:00Z"}
+            for entry_id in entry_ids
+        ],
+        "meta": {"total": total},
+    }
+
+
+class TestListAll:
+    """Tests for TimeEntriesAPI.list_all()."""
+
+    def test_fetches_every_page_in_order(self, httpx_mock, mock_config):
+        """Verify pages after the first are fetched and merged in page order."""
+        for page, ids in ((1, list(range(1, 101))), (2, list(range(101, 201))), (3, [201])):
+            httpx_mock.add_response(
+                url=re.compile(rf".*/time_entries\?.*page={page}&.*"),
+                json=entries_page(ids, total=201),
+            )
+
+        with FreshBooksClient(mock_config) as client:
+            client._account_id = "ABC123"
+            client._business_id = 98765
+            entries = TimeEntriesAPI(client).list_all()
+
+        assert [e.id for e in entries] == list(range(1, 202))
+
+
+class TestParseEntries:
+    """Tests for time entry row parsing."""
+
+    def test_parses_utc_timestamps_and_skips_malformed(self, mock_config):
+        """Verify Z-suffixed timestamps parse as UTC and bad rows are counted."""
+        with FreshBooksClient(mock_config) as client:
+            entries, skipped = TimeEntriesAPI(client)._parse_entries([
+                {"id": 1, "identity_id": 7, "duration": 3600, "started_at": "2026-01-15T09:30:00Z"},
+                {"id": 2, "identity_id": 7, "started_at": "not a date"},
+                {"id": 3, "started_at": "2026-01-15T09:30:00Z"},
+            ])
+
+        assert skipped == 2
+        assert [e.id for e in entries] == [1]
+        assert entries[0].started_at == datetime(2026, 1, 15, 9, 30, tzinfo=timezone.utc)